@@ -7,6 +7,7 @@ import (
 	"os"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/danewalton/imessage-cli/internal/database"
@@ -30,33 +31,74 @@ const (
 )
 
 func colored(text string, colors ...string) string {
-	if !isTerminal() {
+	if !stdoutIsTerminal() {
 		return text
 	}
+	// Every call site passes one or two colors; concatenate those directly
+	// so the result is built in a single allocation.
+	switch len(colors) {
+	case 1:
+		return colors[0] + text + colorReset
+	case 2:
+		return colors[0] + colors[1] + text + colorReset
+	}
 	return strings.Join(colors, "") + text + colorReset
 }
 
+// colorPrefix returns the escape sequence that starts the given colors, or ""
+// when stdout is not a terminal. Pair it with resetSuffix() to color values
+// inside per-row loops without a colored() call per row.
+func colorPrefix(colors ...string) string {
+	if !stdoutIsTerminal() {
+		return ""
+	}
+	return strings.Join(colors, "")
+}
+
+// resetSuffix returns the color reset sequence, or "" when stdout is not a terminal.
+func resetSuffix() string {
+	if !stdoutIsTerminal() {
+		return ""
+	}
+	return colorReset
+}
+
+// stdoutIsTerminal reports whether stdout is a terminal. The underlying
+// fstat runs once per process rather than once per colored string.
+var stdoutIsTerminal = sync.OnceValue(isTerminal)
+
 func isTerminal() bool {
-	fileInfo, _ := os.Stdout.Stat()
+	fileInfo, err := os.Stdout.Stat()
+	if err != nil {
+		return false
+	}
 	return (fileInfo.Mode() & os.ModeCharDevice) != 0
 }
 
-func formatDate(t *time.Time) string {
+// Date layouts used by formatDate
+const (
+	layoutTime     = "03:04 PM"
+	layoutWeekday  = "Monday 03:04 PM"
+	layoutFullDate = "2006-01-02 03:04 PM"
+)
+
+// formatDate formats t relative to now. Callers rendering many rows take
+// time.Now() once and pass it in rather than reading the clock per row.
+func formatDate(t *time.Time, now time.Time) string {
 	if t == nil {
 		return "Unknown"
 	}
 
-	now := time.Now()
 	diff := now.Sub(*t)
 
-	if diff.Hours() < 24 {
-		return t.Format("03:04 PM")
-	} else if diff.Hours() < 48 {
-		return "Yesterday " + t.Format("03:04 PM")
-	} else if diff.Hours() < 168 { // 7 days
-		return t.Format("Monday 03:04 PM")
+	if diff < 24*time.Hour {
+		return t.Format(layoutTime)
+	} else if diff < 48*time.Hour {
+		return "Yesterday " + t.Format(layoutTime)
+	} else if diff < 7*24*time.Hour {
+		return t.Format(layoutWeekday)
 	}
-	return t.Format("2006-01-02 03:04 PM")
+	return t.Format(layoutFullDate)
 }
 
 func truncate(text string, maxLen int) string {
@@ -140,7 +182,8 @@ var searchCmd = &cobra.Command{
 	Args:    cobra.ExactArgs(1),
 	Run: func(cmd *cobra.Command, args []string) {
 		limit, _ := cmd.Flags().GetInt("limit")
-		cmdSearch(args[0], limit)
+		days, _ := cmd.Flags().GetInt("days")
+		cmdSearch(args[0], limit, days)
 	},
 }
 
@@ -187,6 +230,7 @@ func init() {
 	readCmd.Flags().IntP("limit", "n", 30, "Number of messages to show")
 	sendCmd.Flags().BoolP("yes", "y", false, "Skip confirmation prompt")
 	searchCmd.Flags().IntP("limit", "n", 20, "Maximum results")
+	searchCmd.Flags().IntP("days", "d", 0, "Only search messages from the last N days (0 = all)")
 
 	rootCmd.AddCommand(listCmd)
 	rootCmd.AddCommand(readCmd)
@@ -206,6 +250,10 @@ func Execute() error {
 }
 
 func cmdList(limit int) {
+	// Load contacts in parallel with the chat.db query; name lookups wait for
+	// the load to finish.
+	go database.PreloadContacts()
+
 	conversations, err := database.GetConversations(limit)
 	if err != nil {
 		fmt.Println(colored(fmt.Sprintf("Error: %v", err), colorRed))
@@ -217,35 +265,55 @@ func cmdList(limit int) {
 		return
 	}
 
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
 	header := fmt.Sprintf("\n%-4s %-30s %-20s %-10s", "#", "Contact", "Last Message", "Service")
-	fmt.Println(colored(header, colorBold, colorCyan))
-	fmt.Println(strings.Repeat("-", 70))
+	fmt.Fprintln(out, colored(header, colorBold, colorCyan))
+	fmt.Fprintln(out, strings.Repeat("-", 70))
 
+	blue, green, reset := colorPrefix(colorBlue), colorPrefix(colorGreen), resetSuffix()
+	now := time.Now()
 	for i, conv := range conversations {
 		name := truncate(conv.DisplayName, 28)
-		dateStr := formatDate(conv.LastMessageDate)
+		dateStr := formatDate(conv.LastMessageDate, now)
 		service := conv.Service
 		if service == "" {
 			service = "iMessage"
 		}
 
-		serviceColor := colorBlue
+		serviceColor := blue
 		if strings.Contains(service, "SMS") {
-			serviceColor = colorGreen
+			serviceColor = green
 		}
 
-		fmt.Printf("%-4d %-30s %-20s %s\n", i+1, name, dateStr, colored(service, serviceColor))
+		fmt.Fprintf(out, "%-4d %-30s %-20s %s%s%s\n", i+1, name, dateStr, serviceColor, service, reset)
 	}
 
 	unread, _ := database.GetUnreadCount()
 	if unread > 0 {
-		fmt.Println(colored(fmt.Sprintf("\n📬 %d unread message(s)", unread), colorYellow, colorBold))
+		fmt.Fprintln(out, colored(fmt.Sprintf("\n📬 %d unread message(s)", unread), colorYellow, colorBold))
 	}
 
-	fmt.Println(colored("\nTip: Use 'imessage read <number>' to view messages from a conversation", colorDim))
+	fmt.Fprintln(out, colored("\nTip: Use 'imessage read <number>' to view messages from a conversation", colorDim))
+}
+
+// lookupChat resolves a phone number or email typed by the user to the chat
+// identifier of the matching handle and a name to show for it. Unknown
+// identifiers are returned unchanged.
+func lookupChat(identifier string) (chatIdentifier, chatName string) {
+	contact, _ := database.GetContactByIdentifier(identifier)
+	if contact == nil {
+		return identifier, identifier
+	}
+	return contact.ChatIdentifier, contact.DisplayName
 }
 
 func cmdRead(conversation string, limit int) {
+	// Load contacts in parallel with the chat.db query; name lookups wait for
+	// the load to finish.
+	go database.PreloadContacts()
+
 	conversations, err := database.GetConversations(100)
 	if err != nil {
 		fmt.Println(colored(fmt.Sprintf("Error: %v", err), colorRed))
@@ -269,20 +337,7 @@ func cmdRead(conversation string, limit int) {
 		}
 	} else {
 		// User provided a phone number or identifier
-		chatIdentifier = conversation
-		contact, _ := database.GetContactByIdentifier(chatIdentifier)
-		if contact != nil {
-			if contact.ChatIdentifier != "" {
-				chatIdentifier = contact.ChatIdentifier
-			}
-			if contact.DisplayName != "" {
-				chatName = contact.DisplayName
-			} else {
-				chatName = chatIdentifier
-			}
-		} else {
-			chatName = chatIdentifier
-		}
+		chatIdentifier, chatName = lookupChat(conversation)
 	}
 
 	var messages []database.Message
@@ -297,37 +352,43 @@ func cmdRead(conversation string, limit int) {
 		os.Exit(1)
 	}
 
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
 	if len(messages) == 0 {
-		fmt.Printf("No messages found for %s\n", chatName)
+		fmt.Fprintf(out, "No messages found for %s\n", chatName)
 		return
 	}
 
-	fmt.Println(colored(fmt.Sprintf("\n📱 Messages with %s", chatName), colorBold, colorCyan))
-	fmt.Println(strings.Repeat("-", 60))
+	fmt.Fprintln(out, colored(fmt.Sprintf("\n📱 Messages with %s", chatName), colorBold, colorCyan))
+	fmt.Fprintln(out, strings.Repeat("-", 60))
 
+	dim, senderColor, reset := colorPrefix(colorDim), colorPrefix(colorBlue, colorBold), resetSuffix()
+	meLabel := colored("Me:", colorGreen, colorBold)
+	now := time.Now()
 	for _, msg := range messages {
-		dateStr := formatDate(msg.Date)
+		dateStr := dim + formatDate(msg.Date, now) + reset
 		text := msg.Text
 		if text == "" {
 			text = "[No text content]"
 		}
 
 		if msg.IsFromMe {
-			fmt.Printf("\n%58s\n", colored(dateStr, colorDim))
-			fmt.Printf("%10s %s\n", colored("Me:", colorGreen, colorBold), text)
+			fmt.Fprintf(out, "\n%58s\n", dateStr)
+			fmt.Fprintf(out, "%10s %s\n", meLabel, text)
 		} else {
-			fmt.Printf("\n%s\n", colored(dateStr, colorDim))
-			fmt.Printf("%s %s\n", colored(msg.Sender+":", colorBlue, colorBold), text)
+			fmt.Fprintf(out, "\n%s\n", dateStr)
+			fmt.Fprintf(out, "%s%s:%s %s\n", senderColor, msg.Sender, reset, text)
 		}
 	}
 
-	fmt.Println("\n" + strings.Repeat("-", 60))
+	fmt.Fprintln(out, "\n"+strings.Repeat("-", 60))
 
 	replyTarget := chatIdentifier
 	if replyTarget == "" {
 		replyTarget = conversation
 	}
-	fmt.Println(colored(fmt.Sprintf("Reply: imessage send \"%s\" \"your message\"", replyTarget), colorDim))
+	fmt.Fprintln(out, colored(fmt.Sprintf("Reply: imessage send \"%s\" \"your message\"", replyTarget), colorDim))
 }
 
 func cmdSend(recipient, message string, skipConfirm bool) {
@@ -362,6 +423,10 @@ func cmdSend(recipient, message string, skipConfirm bool) {
 }
 
 func cmdChat(contact string) {
+	// Load contacts in parallel with the chat.db query; name lookups wait for
+	// the load to finish.
+	go database.PreloadContacts()
+
 	conversations, err := database.GetConversations(100)
 	if err != nil {
 		fmt.Println(colored(fmt.Sprintf("Error: %v", err), colorRed))
@@ -384,20 +449,7 @@ func cmdChat(contact string) {
 			os.Exit(1)
 		}
 	} else {
-		chatIdentifier = contact
-		c, _ := database.GetContactByIdentifier(chatIdentifier)
-		if c != nil {
-			if c.ChatIdentifier != "" {
-				chatIdentifier = c.ChatIdentifier
-			}
-			if c.DisplayName != "" {
-				chatName = c.DisplayName
-			} else {
-				chatName = chatIdentifier
-			}
-		} else {
-			chatName = chatIdentifier
-		}
+		chatIdentifier, chatName = lookupChat(contact)
 	}
 
 	fmt.Println(colored(fmt.Sprintf("\n💬 Chat with %s", chatName), colorBold, colorCyan))
@@ -413,16 +465,14 @@ func cmdChat(contact string) {
 			messages, _ = database.GetMessages(0, chatIdentifier, 10)
 		}
 
+		green, blue, reset := colorPrefix(colorGreen), colorPrefix(colorBlue), resetSuffix()
+		now := time.Now()
 		for _, msg := range messages {
-			dateStr := formatDate(msg.Date)
-			text := msg.Text
-			if text == "" {
-				text = ""
-			}
+			dateStr := formatDate(msg.Date, now)
 			if msg.IsFromMe {
-				fmt.Printf("  %s %s\n", colored(fmt.Sprintf("[%s] Me:", dateStr), colorGreen), text)
+				fmt.Printf("  %s[%s] Me:%s %s\n", green, dateStr, reset, msg.Text)
 			} else {
-				fmt.Printf("  %s %s\n", colored(fmt.Sprintf("[%s] %s:", dateStr, msg.Sender), colorBlue), text)
+				fmt.Printf("  %s[%s] %s:%s %s\n", blue, dateStr, msg.Sender, reset, msg.Text)
 			}
 		}
 		fmt.Println()
@@ -462,23 +512,41 @@ func cmdChat(contact string) {
 	}
 }
 
-func cmdSearch(query string, limit int) {
-	results, err := database.SearchMessages(query, limit)
+func cmdSearch(query string, limit, days int) {
+	// Load contacts in parallel with the chat.db query; name lookups wait for
+	// the load to finish.
+	go database.PreloadContacts()
+
+	var since time.Time
+	if days > 0 {
+		since = time.Now().AddDate(0, 0, -days)
+	}
+
+	if !database.SearchIndexBuilt() {
+		fmt.Fprintln(os.Stderr, colored("Building the search index (first search only, this may take a minute)...", colorYellow))
+	}
+
+	results, err := database.SearchMessagesSince(query, since, limit)
 	if err != nil {
 		fmt.Println(colored(fmt.Sprintf("Error searching: %v", err), colorRed))
 		os.Exit(1)
 	}
 
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
 	if len(results) == 0 {
-		fmt.Printf("No messages found matching '%s'\n", query)
+		fmt.Fprintf(out, "No messages found matching '%s'\n", query)
 		return
 	}
 
-	fmt.Println(colored(fmt.Sprintf("\nSearch results for '%s':", query), colorBold, colorCyan))
-	fmt.Println(strings.Repeat("-", 70))
+	fmt.Fprintln(out, colored(fmt.Sprintf("\nSearch results for '%s':", query), colorBold, colorCyan))
+	fmt.Fprintln(out, strings.Repeat("-", 70))
 
+	cyan, yellow, reset := colorPrefix(colorCyan), colorPrefix(colorYellow), resetSuffix()
+	now := time.Now()
 	for _, msg := range results {
-		dateStr := formatDate(msg.Date)
+		dateStr := formatDate(msg.Date, now)
 		chat := truncate(msg.ChatName, 20)
 		senderName := "Me"
 		if !msg.IsFromMe {
@@ -486,14 +554,14 @@ func cmdSearch(query string, limit int) {
 		}
 		text := truncate(msg.Text, 40)
 
-		fmt.Printf("%-20s %s %-17s %s\n",
+		fmt.Fprintf(out, "%-20s %s%-22s%s %-17s %s\n",
 			dateStr,
-			colored(fmt.Sprintf("%-22s", chat), colorCyan),
-			colored(senderName, colorYellow),
+			cyan, chat, reset,
+			yellow+senderName+reset,
 			text)
 	}
 
-	fmt.Printf("\nFound %d message(s)\n", len(results))
+	fmt.Fprintf(out, "\nFound %d message(s)\n", len(results))
 }
 
 func cmdStatus() {
@@ -516,11 +584,11 @@ func cmdStatus() {
 	}
 
 	// Show stats
-	conversations, _ := database.GetConversations(1000)
+	conversations, _ := database.GetConversationCount()
 	unread, _ := database.GetUnreadCount()
 
 	fmt.Println("\n📈 Statistics:")
-	fmt.Printf("   Conversations: %d\n", len(conversations))
+	fmt.Printf("   Conversations: %d\n", conversations)
 	fmt.Printf("   Unread messages: %d\n", unread)
 	fmt.Println()
 }
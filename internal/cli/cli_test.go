@@ -0,0 +1,31 @@
+package cli
+
+import (
+	"testing"
+	"time"
+)
+
+func TestFormatDate(t *testing.T) {
+	if got := formatDate(nil, time.Now()); got != "Unknown" {
+		t.Errorf("formatDate(nil) = %q, want %q", got, "Unknown")
+	}
+
+	// Wednesday
+	now := time.Date(2024, time.March, 13, 15, 0, 0, 0, time.Local)
+	tests := []struct {
+		name string
+		t    time.Time
+		want string
+	}{
+		{"today", time.Date(2024, time.March, 13, 9, 5, 0, 0, time.Local), "09:05 AM"},
+		{"under a day ago", time.Date(2024, time.March, 12, 23, 30, 0, 0, time.Local), "11:30 PM"},
+		{"yesterday", time.Date(2024, time.March, 12, 8, 0, 0, 0, time.Local), "Yesterday 08:00 AM"},
+		{"this week", time.Date(2024, time.March, 9, 12, 0, 0, 0, time.Local), "Saturday 12:00 PM"},
+		{"older", time.Date(2024, time.January, 2, 13, 45, 0, 0, time.Local), "2024-01-02 01:45 PM"},
+	}
+	for _, tt := range tests {
+		if got := formatDate(&tt.t, now); got != tt.want {
+			t.Errorf("%s: formatDate(%v) = %q, want %q", tt.name, tt.t, got, tt.want)
+		}
+	}
+}
@@ -0,0 +1,128 @@
+// This file holds the on-disk cache for resolved contacts.
+
+package database
+
+import (
+	"encoding/gob"
+	"os"
+	"path/filepath"
+)
+
+// contactCacheVersion must be bumped whenever the layout of the cached maps
+// (including the phone key format) changes.
+const contactCacheVersion = 3
+
+// contactSource identifies one AddressBook database by its modification state.
+// Contacts.app writes through WAL, so the -wal file is tracked as well.
+type contactSource struct {
+	Path       string
+	ModTime    int64
+	WALModTime int64
+	WALSize    int64
+}
+
+// contactCache is the gob-encoded payload stored between invocations.
+type contactCache struct {
+	Version     int
+	Sources     []contactSource
+	PhoneToName map[string]string
+	EmailToName map[string]string
+}
+
+// getContactCachePath returns the location of the contact cache file.
+func getContactCachePath() string {
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		return ""
+	}
+	return filepath.Join(dir, "imessage-cli", "contacts.gob")
+}
+
+// statContactSources records the current modification state of each database.
+func statContactSources(dbPaths []string) []contactSource {
+	sources := make([]contactSource, 0, len(dbPaths))
+	for _, p := range dbPaths {
+		src := contactSource{Path: p}
+		if info, err := os.Stat(p); err == nil {
+			src.ModTime = info.ModTime().UnixNano()
+		}
+		if info, err := os.Stat(p + "-wal"); err == nil {
+			src.WALModTime = info.ModTime().UnixNano()
+			src.WALSize = info.Size()
+		}
+		sources = append(sources, src)
+	}
+	return sources
+}
+
+func sameContactSources(a, b []contactSource) bool {
+	if len(a) != len(b) {
+		return false
+	}
+	for i := range a {
+		if a[i] != b[i] {
+			return false
+		}
+	}
+	return true
+}
+
+// readContactCache returns the cached maps if they were built from exactly
+// the given sources.
+func readContactCache(sources []contactSource) (*contactCache, bool) {
+	path := getContactCachePath()
+	if path == "" {
+		return nil, false
+	}
+
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, false
+	}
+	defer f.Close()
+
+	var cache contactCache
+	if err := gob.NewDecoder(f).Decode(&cache); err != nil {
+		return nil, false
+	}
+	if cache.Version != contactCacheVersion || !sameContactSources(cache.Sources, sources) {
+		return nil, false
+	}
+	return &cache, true
+}
+
+// writeContactCache stores the maps atomically (temp file + rename) so a
+// concurrent reader never sees a partial file. Errors are ignored; the cache
+// is purely an optimization.
+func writeContactCache(sources []contactSource, phoneToName, emailToName map[string]string) {
+	path := getContactCachePath()
+	if path == "" {
+		return
+	}
+
+	dir := filepath.Dir(path)
+	if err := os.MkdirAll(dir, 0700); err != nil {
+		return
+	}
+
+	tmp, err := os.CreateTemp(dir, "contacts-*.tmp")
+	if err != nil {
+		return
+	}
+	defer os.Remove(tmp.Name())
+
+	cache := contactCache{
+		Version:     contactCacheVersion,
+		Sources:     sources,
+		PhoneToName: phoneToName,
+		EmailToName: emailToName,
+	}
+	if err := gob.NewEncoder(tmp).Encode(&cache); err != nil {
+		tmp.Close()
+		return
+	}
+	if err := tmp.Close(); err != nil {
+		return
+	}
+	os.Rename(tmp.Name(), path)
+}
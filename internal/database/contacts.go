@@ -8,6 +8,7 @@ import (
 	"strings"
 	"sync"
 	"unicode"
+	"unicode/utf8"
 )
 
 var (
@@ -16,11 +17,18 @@ var (
 )
 
 // ContactResolver resolves phone numbers and email addresses to contact names.
+// The maps are written only inside loadOnce and are read-only afterwards, so
+// lookups need no locking.
 type ContactResolver struct {
 	phoneToName map[string]string
 	emailToName map[string]string
-	loaded      bool
-	mu          sync.RWMutex
+	loadOnce    sync.Once
+	// empty is set when no contacts could be loaded (e.g. AddressBook access
+	// is denied), letting Resolve return the identifier without any work.
+	empty bool
+	// resolved memoizes Resolve by raw identifier. The maps never change
+	// after loading, so entries stay valid for the life of the resolver.
+	resolved sync.Map
 }
 
 // NewContactResolver creates a new ContactResolver.
@@ -39,6 +47,32 @@ func GetContactName(identifier string) string {
 	return resolver.Resolve(identifier)
 }
 
+// nameLookup memoizes contact names for the rows of a single query. A page of
+// messages usually comes from a handful of senders, so each distinct
+// identifier is normalized and looked up once instead of once per row.
+type nameLookup map[string]string
+
+// name returns the contact name for identifier, as GetContactName does.
+func (n nameLookup) name(identifier string) string {
+	if name, ok := n[identifier]; ok {
+		return name
+	}
+	name := GetContactName(identifier)
+	n[identifier] = name
+	return name
+}
+
+// sender resolves a sender the same way ResolveSender does.
+func (n nameLookup) sender(isFromMe bool, senderID string) string {
+	if isFromMe {
+		return "Me"
+	}
+	if senderID != "" {
+		return n.name(senderID)
+	}
+	return "Unknown"
+}
+
 // PreloadContacts loads contacts into memory.
 func PreloadContacts() {
 	resolverOnce.Do(func() {
@@ -81,162 +115,178 @@ func NormalizePhoneNumber(phone string) string {
 	}
 
 	phone = strings.TrimSpace(phone)
-	hasPlus := strings.HasPrefix(phone, "+")
+	digits := digitsOnly(phone)
 
-	var digits strings.Builder
-	for _, c := range phone {
-		if unicode.IsDigit(c) {
-			digits.WriteRune(c)
-		}
+	if strings.HasPrefix(phone, "+") {
+		return "+" + digits
 	}
+	return digits
+}
 
-	if hasPlus {
-		return "+" + digits.String()
+// digitsOnly returns the digits of s in order.
+func digitsOnly(s string) string {
+	buf, ok := appendASCIIDigits(make([]byte, 0, len(s)), s)
+	if !ok {
+		return digitsOnlyRunes(s)
 	}
-	return digits.String()
+	if len(buf) == len(s) {
+		return s
+	}
+	return string(buf)
 }
 
-// GetPhoneVariants generates common variants of a phone number for matching.
-func GetPhoneVariants(phone string) []string {
-	if phone == "" {
-		return nil
+// appendASCIIDigits appends the ASCII digits of s to dst. ASCII input, which
+// covers virtually every stored phone number, is filtered byte-by-byte; ok is
+// false if s contains non-ASCII text and needs a rune-aware scan instead.
+func appendASCIIDigits(dst []byte, s string) (out []byte, ok bool) {
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		if c >= utf8.RuneSelf {
+			return dst, false
+		}
+		if c >= '0' && c <= '9' {
+			dst = append(dst, c)
+		}
 	}
+	return dst, true
+}
 
-	variants := []string{phone}
-	var digitsBuilder strings.Builder
-	for _, c := range phone {
+func digitsOnlyRunes(s string) string {
+	var digits strings.Builder
+	for _, c := range s {
 		if unicode.IsDigit(c) {
-			digitsBuilder.WriteRune(c)
+			digits.WriteRune(c)
 		}
 	}
-	digits := digitsBuilder.String()
-
-	if digits == "" {
-		return variants
-	}
+	return digits.String()
+}
 
-	// Add version with + prefix
-	if !strings.HasPrefix(phone, "+") {
-		variants = append(variants, "+"+digits)
+// canonicalPhone reduces a phone number to the single key used by
+// phoneToName, so that "+15551234567", "15551234567", "5551234567" and
+// "(555) 123-4567" all map to "+15551234567". Ten-digit numbers without a
+// leading "+" are assumed to be US numbers missing their country code; a
+// number written with "+" already carries one and only keeps its digits.
+func canonicalPhone(phone string) string {
+	// The first two bytes are reserved for the "+" / "+1" prefix so the key
+	// is assembled in a single allocation.
+	buf, ok := appendASCIIDigits(make([]byte, 2, len(phone)+2), phone)
+	if !ok {
+		buf = append(buf[:2], digitsOnlyRunes(phone)...)
 	}
 
-	// Handle US phone numbers
-	if len(digits) == 10 {
-		variants = append(variants, "+1"+digits)
-		variants = append(variants, "1"+digits)
-	} else if len(digits) == 11 && strings.HasPrefix(digits, "1") {
-		variants = append(variants, digits[1:])
-		variants = append(variants, "+"+digits)
+	switch digits := len(buf) - 2; {
+	case digits == 0:
+		return ""
+	case digits == 10 && !strings.HasPrefix(strings.TrimSpace(phone), "+"):
+		buf[0], buf[1] = '+', '1'
+		return string(buf)
+	default:
+		buf[1] = '+'
+		return string(buf[1:])
 	}
-
-	return variants
 }
 
-// loadContacts loads contacts from all AddressBook databases.
+// loadContacts loads contacts from all AddressBook databases. Concurrent
+// callers block until the first load has finished.
 func (cr *ContactResolver) loadContacts() {
-	cr.mu.Lock()
-	defer cr.mu.Unlock()
+	cr.loadOnce.Do(func() {
+		cr.loadAll()
+		cr.empty = len(cr.phoneToName) == 0 && len(cr.emailToName) == 0
+	})
+}
 
-	if cr.loaded {
+func (cr *ContactResolver) loadAll() {
+	dbPaths := getAddressBookPaths()
+	if len(dbPaths) == 0 {
 		return
 	}
-	cr.loaded = true
 
-	dbPaths := getAddressBookPaths()
+	// Reuse the maps from a previous run when no AddressBook has changed
+	sources := statContactSources(dbPaths)
+	if cache, ok := readContactCache(sources); ok {
+		if cache.PhoneToName != nil {
+			cr.phoneToName = cache.PhoneToName
+		}
+		if cache.EmailToName != nil {
+			cr.emailToName = cache.EmailToName
+		}
+		return
+	}
+
+	// Only cache a complete load: maps missing a database (locked while
+	// Contacts syncs, unexpected schema) would otherwise be reused until
+	// some AddressBook changes.
+	complete := true
 	for _, dbPath := range dbPaths {
-		cr.loadFromDatabase(dbPath)
+		if err := cr.loadFromDatabase(dbPath); err != nil {
+			complete = false
+		}
+	}
+	if complete {
+		writeContactCache(sources, cr.phoneToName, cr.emailToName)
 	}
 }
 
 // loadFromDatabase loads contacts from a single AddressBook database.
-func (cr *ContactResolver) loadFromDatabase(dbPath string) {
-	connStr := "file:" + dbPath + "?mode=ro"
+func (cr *ContactResolver) loadFromDatabase(dbPath string) error {
+	// A 32 MiB page cache plus mmap lets the join read pages straight from the
+	// mapped file instead of issuing a read() per page.
+	connStr := "file:" + dbPath + "?mode=ro&_cache_size=-32768"
 	db, err := sql.Open("sqlite3", connStr)
 	if err != nil {
-		return
+		return err
 	}
 	defer db.Close()
 
-	// Load phone number to name mappings
+	// Pin a single connection so the pragma applies to the query below
+	db.SetMaxOpenConns(1)
+	db.Exec("PRAGMA mmap_size=268435456")
+
+	// Load phone and email mappings in a single pass; the first column tells
+	// which table a row came from. The display name is "First Last" when
+	// either part is set, otherwise the organization.
 	rows, err := db.Query(`
 		SELECT 
-			r.ZFIRSTNAME,
-			r.ZLASTNAME,
-			r.ZORGANIZATION,
-			p.ZFULLNUMBER
+			'p' as kind,
+			COALESCE(NULLIF(TRIM(COALESCE(r.ZFIRSTNAME, '') || ' ' || COALESCE(r.ZLASTNAME, '')), ''),
+				r.ZORGANIZATION, '') as display_name,
+			p.ZFULLNUMBER as value
 		FROM ZABCDRECORD r
 		JOIN ZABCDPHONENUMBER p ON r.Z_PK = p.ZOWNER
-		WHERE p.ZFULLNUMBER IS NOT NULL
-	`)
-	if err == nil {
-		defer rows.Close()
-		for rows.Next() {
-			var firstName, lastName, organization, phone sql.NullString
-			if err := rows.Scan(&firstName, &lastName, &organization, &phone); err != nil {
-				continue
-			}
-
-			displayName := buildDisplayName(firstName.String, lastName.String, organization.String)
-			if displayName == "" || !phone.Valid {
-				continue
-			}
-
-			normalized := NormalizePhoneNumber(phone.String)
-			if normalized != "" {
-				cr.phoneToName[normalized] = displayName
-				for _, variant := range GetPhoneVariants(normalized) {
-					if _, exists := cr.phoneToName[variant]; !exists {
-						cr.phoneToName[variant] = displayName
-					}
-				}
-			}
-		}
-	}
-
-	// Load email to name mappings
-	rows, err = db.Query(`
+		WHERE p.ZFULLNUMBER IS NOT NULL AND LENGTH(p.ZFULLNUMBER) > 0 AND display_name <> ''
+		UNION ALL
 		SELECT 
-			r.ZFIRSTNAME,
-			r.ZLASTNAME,
-			r.ZORGANIZATION,
-			e.ZADDRESS
+			'e' as kind,
+			COALESCE(NULLIF(TRIM(COALESCE(r.ZFIRSTNAME, '') || ' ' || COALESCE(r.ZLASTNAME, '')), ''),
+				r.ZORGANIZATION, '') as display_name,
+			e.ZADDRESS as value
 		FROM ZABCDRECORD r
 		JOIN ZABCDEMAILADDRESS e ON r.Z_PK = e.ZOWNER
-		WHERE e.ZADDRESS IS NOT NULL
+		WHERE e.ZADDRESS IS NOT NULL AND LENGTH(e.ZADDRESS) > 0 AND display_name <> ''
 	`)
-	if err == nil {
-		defer rows.Close()
-		for rows.Next() {
-			var firstName, lastName, organization, email sql.NullString
-			if err := rows.Scan(&firstName, &lastName, &organization, &email); err != nil {
-				continue
-			}
-
-			displayName := buildDisplayName(firstName.String, lastName.String, organization.String)
-			if displayName == "" || !email.Valid {
-				continue
-			}
+	if err != nil {
+		return err
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		// Every column is non-empty by construction, so rows scan straight
+		// into strings without sql.NullString wrappers or Go-side filtering.
+		var kind, displayName, value string
+		if err := rows.Scan(&kind, &displayName, &value); err != nil {
+			continue
+		}
 
-			cr.emailToName[strings.ToLower(email.String)] = displayName
+		if kind == "e" {
+			cr.emailToName[strings.ToLower(value)] = displayName
+			continue
 		}
-	}
-}
 
-func buildDisplayName(firstName, lastName, organization string) string {
-	var parts []string
-	if firstName != "" {
-		parts = append(parts, firstName)
-	}
-	if lastName != "" {
-		parts = append(parts, lastName)
-	}
-	if len(parts) > 0 {
-		return strings.Join(parts, " ")
-	}
-	if organization != "" {
-		return organization
+		if key := canonicalPhone(value); key != "" {
+			cr.phoneToName[key] = displayName
+		}
 	}
-	return ""
+	return rows.Err()
 }
 
 // Resolve resolves an identifier (phone/email) to a contact name.
@@ -246,10 +296,20 @@ func (cr *ContactResolver) Resolve(identifier string) string {
 	}
 
 	cr.loadContacts()
+	if cr.empty {
+		return identifier
+	}
 
-	cr.mu.RLock()
-	defer cr.mu.RUnlock()
+	if name, ok := cr.resolved.Load(identifier); ok {
+		return name.(string)
+	}
+	name := cr.lookup(identifier)
+	cr.resolved.Store(identifier, name)
+	return name
+}
 
+// lookup resolves identifier against the loaded maps.
+func (cr *ContactResolver) lookup(identifier string) string {
 	// Check if it's an email
 	if strings.Contains(identifier, "@") {
 		if name, ok := cr.emailToName[strings.ToLower(identifier)]; ok {
@@ -259,27 +319,15 @@ func (cr *ContactResolver) Resolve(identifier string) string {
 	}
 
 	// Try phone number lookup
-	normalized := NormalizePhoneNumber(identifier)
-
-	// Try direct match first
-	if name, ok := cr.phoneToName[normalized]; ok {
+	if name, ok := cr.phoneToName[canonicalPhone(identifier)]; ok {
 		return name
 	}
 
-	// Try variants
-	for _, variant := range GetPhoneVariants(normalized) {
-		if name, ok := cr.phoneToName[variant]; ok {
-			return name
-		}
-	}
-
 	return identifier
 }
 
 // GetContactCount returns the number of loaded contacts.
 func (cr *ContactResolver) GetContactCount() int {
 	cr.loadContacts()
-	cr.mu.RLock()
-	defer cr.mu.RUnlock()
 	return len(cr.phoneToName) + len(cr.emailToName)
 }
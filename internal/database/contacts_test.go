@@ -0,0 +1,59 @@
+package database
+
+import "testing"
+
+func TestCanonicalPhone(t *testing.T) {
+	tests := []struct {
+		in, want string
+	}{
+		{"", ""},
+		{"no digits", ""},
+		{"+15551234567", "+15551234567"},
+		{"15551234567", "+15551234567"},
+		{"5551234567", "+15551234567"},
+		{"(555) 123-4567", "+15551234567"},
+		{" 555.123.4567 ", "+15551234567"},
+		// Ten digits written with "+" already carry a country code
+		{"+4930123456", "+4930123456"},
+		{" +49 30 123456", "+4930123456"},
+		{"+44 20 7946 0958", "+442079460958"},
+		{"1234567", "+1234567"},
+	}
+	for _, tt := range tests {
+		if got := canonicalPhone(tt.in); got != tt.want {
+			t.Errorf("canonicalPhone(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
+
+func TestDigitsOnly(t *testing.T) {
+	tests := []struct {
+		in, want string
+	}{
+		{"", ""},
+		{"5551234", "5551234"},
+		{"+1 (555) 123-4567", "15551234567"},
+		{"no digits", ""},
+		{"٣4-5", "٣45"},
+	}
+	for _, tt := range tests {
+		if got := digitsOnly(tt.in); got != tt.want {
+			t.Errorf("digitsOnly(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
+
+func TestNormalizePhoneNumber(t *testing.T) {
+	tests := []struct {
+		in, want string
+	}{
+		{"", ""},
+		{"+1 (555) 123-4567", "+15551234567"},
+		{" 555-1234 ", "5551234"},
+	}
+	for _, tt := range tests {
+		if got := NormalizePhoneNumber(tt.in); got != tt.want {
+			t.Errorf("NormalizePhoneNumber(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
@@ -2,8 +2,10 @@
 package database
 
 import (
+	"bytes"
 	"database/sql"
 	"fmt"
+	"math"
 	"os"
 	"path/filepath"
 	"regexp"
@@ -11,16 +13,52 @@ import (
 	"sync"
 	"time"
 	"unicode"
+	"unicode/utf8"
 
-	_ "github.com/mattn/go-sqlite3"
+	"github.com/mattn/go-sqlite3"
 )
 
 var (
 	sharedDB   *sql.DB
 	dbOnce     sync.Once
 	dbInitErr  error
+
+	// stmts holds statements prepared on sharedDB, keyed by SQL text
+	stmts  map[string]*sql.Stmt
+	stmtMu sync.Mutex
 )
 
+// chatDBDriver is the driver used for the shared chat.db pool. It applies
+// chatDBPragmas to every connection the pool opens, so the settings hold no
+// matter which pooled connection serves a query.
+const chatDBDriver = "sqlite3_chatdb"
+
+// chat.db can run to hundreds of megabytes, so pages are memory-mapped (up
+// to 1 GiB) and backed by a 64 MiB page cache. query_only makes the
+// read-only intent explicit on each connection. Checkpointing is left
+// entirely to Messages, which owns the database; wal_autocheckpoint only
+// affects our own handles.
+var chatDBPragmas = []string{
+	"PRAGMA cache_size = -65536",
+	"PRAGMA mmap_size = 1073741824",
+	"PRAGMA temp_store = MEMORY",
+	"PRAGMA query_only = 1",
+	"PRAGMA wal_autocheckpoint = 0",
+}
+
+func init() {
+	sql.Register(chatDBDriver, &sqlite3.SQLiteDriver{
+		ConnectHook: func(conn *sqlite3.SQLiteConn) error {
+			for _, pragma := range chatDBPragmas {
+				if _, err := conn.Exec(pragma, nil); err != nil {
+					return err
+				}
+			}
+			return nil
+		},
+	})
+}
+
 // Attachment represents a file attachment on an iMessage.
 type Attachment struct {
 	AttachmentID int64
@@ -75,19 +113,22 @@ func initDB() {
 		}
 
 		// Connect in read-only mode with busy timeout to avoid locking issues
-		// _busy_timeout=3000 waits up to 3 seconds if database is locked
+		// _busy_timeout=5000 waits up to 5 seconds if database is locked
 		// _journal_mode=WAL enables write-ahead logging for better concurrent access
-		connStr := fmt.Sprintf("file:%s?mode=ro&_busy_timeout=3000&_journal_mode=WAL", dbPath)
-		db, err := sql.Open("sqlite3", connStr)
+		connStr := fmt.Sprintf("file:%s?mode=ro&_busy_timeout=5000&_journal_mode=WAL", dbPath)
+		db, err := sql.Open(chatDBDriver, connStr)
 		if err != nil {
 			dbInitErr = err
 			return
 		}
 
-		// Pool settings for a shared long-lived connection
+		// Pool settings for a shared long-lived connection. Connections are
+		// kept for the life of the process so long-running sessions (chat,
+		// tui) never pay to reopen chat.db; each query still reads a fresh
+		// WAL snapshot, so new messages remain visible.
 		db.SetMaxOpenConns(2)
 		db.SetMaxIdleConns(2)
-		db.SetConnMaxLifetime(5 * time.Minute)
+		db.SetConnMaxLifetime(0)
 
 		// Verify the connection is usable
 		if err := db.Ping(); err != nil {
@@ -110,20 +151,71 @@ func DB() (*sql.DB, error) {
 	return sharedDB, nil
 }
 
+// prepared returns query prepared on db, preparing it on first use. The
+// statement is kept until CloseDB, so queries that run on every refresh are
+// parsed and planned once per pooled connection rather than once per call.
+// Only constant SQL should be passed; each distinct string is kept.
+func prepared(db *sql.DB, query string) (*sql.Stmt, error) {
+	stmtMu.Lock()
+	defer stmtMu.Unlock()
+
+	if stmt, ok := stmts[query]; ok {
+		return stmt, nil
+	}
+	stmt, err := db.Prepare(query)
+	if err != nil {
+		return nil, err
+	}
+	if stmts == nil {
+		stmts = make(map[string]*sql.Stmt)
+	}
+	stmts[query] = stmt
+	return stmt, nil
+}
+
+// maxResultCap bounds the capacity preallocated for query results.
+const maxResultCap = 1024
+
+// resultCap returns the capacity to preallocate for a query with the given
+// LIMIT. The limit comes from the -n flag, so it may be negative (SQLite
+// treats that as no limit) or far larger than the rows that exist; beyond
+// maxResultCap the slice grows by append as rows arrive.
+func resultCap(limit int) int {
+	return min(max(limit, 0), maxResultCap)
+}
+
+// Prepare returns query prepared on the shared pool. Like the statements
+// this package uses itself, it is prepared once and kept until CloseDB,
+// so callers that run the same query repeatedly (the watcher's poll loop)
+// skip re-parsing and re-planning it. Only constant SQL should be passed.
+func Prepare(query string) (*sql.Stmt, error) {
+	db, err := DB()
+	if err != nil {
+		return nil, err
+	}
+	return prepared(db, query)
+}
+
 // CloseDB closes the shared database connection pool.
 // Call this during application shutdown for a clean exit.
 func CloseDB() {
+	stmtMu.Lock()
+	for query, stmt := range stmts {
+		stmt.Close()
+		delete(stmts, query)
+	}
+	stmtMu.Unlock()
+
 	if sharedDB != nil {
 		sharedDB.Close()
 		sharedDB = nil
 	}
+	closeSearchIndex()
 }
 
-// GetConnection creates a new standalone connection to the iMessage database.
-// Deprecated: Use DB() for the shared connection pool instead.
-func GetConnection() (*sql.DB, error) {
-	return DB()
-}
+// appleEpochOffset is the number of seconds between the Unix epoch
+// (1970-01-01) and the Apple epoch (2001-01-01).
+const appleEpochOffset = 978307200
 
 // AppleTimeToTime converts Apple's timestamp format to Go time.Time.
 // Apple uses nanoseconds since 2001-01-01, while Unix uses seconds since 1970-01-01.
@@ -133,119 +225,181 @@ func AppleTimeToTime(appleTime int64) *time.Time {
 		return nil
 	}
 
-	const appleEpochOffset = 978307200
-
-	var unixTimestamp float64
-	if appleTime > 1e18 {
-		// Nanoseconds
-		unixTimestamp = float64(appleTime)/1e9 + appleEpochOffset
-	} else if appleTime > 1e9 {
-		// Already in reasonable range, might be nanoseconds
-		unixTimestamp = float64(appleTime)/1e9 + appleEpochOffset
-	} else {
-		unixTimestamp = float64(appleTime) + appleEpochOffset
+	// Values above 1e9 are nanoseconds (macOS 10.13+); smaller values are
+	// seconds from older databases. Integer division keeps this exact and
+	// avoids the float round trip.
+	seconds := appleTime
+	if appleTime > 1e9 {
+		seconds = appleTime / int64(time.Second)
 	}
 
-	t := time.Unix(int64(unixTimestamp), 0)
+	t := time.Unix(seconds+appleEpochOffset, 0)
 	return &t
 }
 
+// TimeToAppleTime converts a Go time.Time to Apple's nanosecond timestamp
+// format, for binding against message.date.
+func TimeToAppleTime(t time.Time) int64 {
+	return t.UnixNano() - appleEpochOffset*int64(time.Second)
+}
+
+// readableRunRe matches runs of printable text in an attributedBody blob.
+var readableRunRe = regexp.MustCompile(`[\x20-\x7E\x{00A0}-\x{FFFF}]{3,}`)
+
+// serializationArtifacts are class and archiver names from the
+// NSKeyedArchiver/typedstream encoding that are never message text.
+var serializationArtifacts = [][]byte{[]byte("bplist"), []byte("NSString"), []byte("NSNumber"),
+	[]byte("NSDictionary"), []byte("NSArray"), []byte("NSData"), []byte("$class"),
+	[]byte("archiver"), []byte("streamtyped")}
+
 // ExtractTextFromAttributedBody extracts plain text from an attributedBody blob.
 // The attributedBody column contains a serialized NSAttributedString.
+//
+// Three strategies are tried in order, each on the raw bytes; only the slice
+// that holds the text is converted to a string.
 func ExtractTextFromAttributedBody(data []byte) string {
-	if data == nil || len(data) == 0 {
+	if len(data) == 0 {
 		return ""
 	}
 
-	// Decode as UTF-8, replacing invalid characters
-	decoded := string(data)
-
-	// Method 1: The attributed body contains serialized NSAttributedString data
-	if strings.Contains(decoded, "NSNumber") {
-		temp := strings.Split(decoded, "NSNumber")[0]
-		if strings.Contains(temp, "NSString") {
-			temp = strings.Split(temp, "NSString")[1]
-			if strings.Contains(temp, "NSDictionary") {
-				temp = strings.Split(temp, "NSDictionary")[0]
-				// Remove leading/trailing serialization bytes
-				if len(temp) > 18 {
-					temp = temp[6 : len(temp)-12]
-				}
-				// Clean up the text
-				cleaned := cleanPrintable(temp)
-				if len(strings.TrimSpace(cleaned)) > 0 {
-					return strings.TrimSpace(cleaned)
-				}
-			}
-		}
+	if text := extractBetweenMarkers(data); text != "" {
+		return text
+	}
+	if text := extractAfterStreamtyped(data); text != "" {
+		return text
 	}
+	return extractLongestReadableRun(data)
+}
 
-	// Method 2: Try to find text after streamtyped marker
-	if strings.Contains(string(data), "streamtyped") {
-		parts := strings.Split(decoded, "NSString")
-		if len(parts) > 1 {
-			textPart := parts[1]
-			cleaned := cleanPrintable(textPart)
-			// Find where the actual text ends (before next marker)
-			for _, marker := range []string{"NSDictionary", "NSNumber", "NSArray"} {
-				if strings.Contains(cleaned, marker) {
-					cleaned = strings.Split(cleaned, marker)[0]
-				}
-			}
-			cleaned = strings.TrimSpace(cleaned)
-			if len(cleaned) > 1 {
-				return cleaned
-			}
-		}
+var (
+	markerNSString     = []byte("NSString")
+	markerNSNumber     = []byte("NSNumber")
+	markerNSDictionary = []byte("NSDictionary")
+	markerStreamtyped  = []byte("streamtyped")
+)
+
+// afterFirst returns the part of data between the first and second
+// occurrence of sep (or the end of data), and whether sep was found.
+func afterFirst(data, sep []byte) ([]byte, bool) {
+	i := bytes.Index(data, sep)
+	if i < 0 {
+		return nil, false
+	}
+	rest := data[i+len(sep):]
+	if j := bytes.Index(rest, sep); j >= 0 {
+		rest = rest[:j]
 	}
+	return rest, true
+}
 
-	// Method 3: Look for any readable text using regex
-	re := regexp.MustCompile(`[\x20-\x7E\u00A0-\uFFFF]{3,}`)
-	matches := re.FindAllString(decoded, -1)
-	if len(matches) > 0 {
-		// Filter out known serialization artifacts
-		artifacts := []string{"bplist", "NSString", "NSNumber", "NSDictionary",
-			"NSArray", "NSData", "$class", "archiver", "streamtyped"}
+// extractBetweenMarkers handles the common NSKeyedArchiver layout, where the
+// text sits between the first NSString and the following NSDictionary, all
+// before the first NSNumber.
+func extractBetweenMarkers(data []byte) string {
+	end := bytes.Index(data, markerNSNumber)
+	if end < 0 {
+		return ""
+	}
+	temp, ok := afterFirst(data[:end], markerNSString)
+	if !ok {
+		return ""
+	}
+	end = bytes.Index(temp, markerNSDictionary)
+	if end < 0 {
+		return ""
+	}
+	temp = temp[:end]
+	// Remove leading/trailing serialization bytes
+	if len(temp) > 18 {
+		temp = temp[6 : len(temp)-12]
+	}
+	return strings.TrimSpace(cleanPrintable(string(temp)))
+}
 
-		var filtered []string
-		for _, m := range matches {
-			hasArtifact := false
-			for _, artifact := range artifacts {
-				if strings.Contains(m, artifact) {
-					hasArtifact = true
-					break
-				}
-			}
-			if !hasArtifact && len(strings.TrimSpace(m)) > 2 {
-				filtered = append(filtered, strings.TrimSpace(m))
-			}
+// extractAfterStreamtyped handles typedstream blobs: the text follows the
+// first NSString and runs up to the next class marker.
+func extractAfterStreamtyped(data []byte) string {
+	if !bytes.Contains(data, markerStreamtyped) {
+		return ""
+	}
+	textPart, ok := afterFirst(data, markerNSString)
+	if !ok {
+		return ""
+	}
+	cleaned := cleanPrintable(string(textPart))
+	// Find where the actual text ends (before next marker)
+	for _, marker := range []string{"NSDictionary", "NSNumber", "NSArray"} {
+		if i := strings.Index(cleaned, marker); i >= 0 {
+			cleaned = cleaned[:i]
 		}
+	}
+	cleaned = strings.TrimSpace(cleaned)
+	if len(cleaned) > 1 {
+		return cleaned
+	}
+	return ""
+}
 
-		if len(filtered) > 0 {
-			// Return the longest match
-			longest := filtered[0]
-			for _, f := range filtered {
-				if len(f) > len(longest) {
-					longest = f
-				}
+// extractLongestReadableRun is the last resort: the longest run of readable
+// characters that is not a serialization artifact.
+func extractLongestReadableRun(data []byte) string {
+	var longest []byte
+	for _, m := range readableRunRe.FindAll(data, -1) {
+		hasArtifact := false
+		for _, artifact := range serializationArtifacts {
+			if bytes.Contains(m, artifact) {
+				hasArtifact = true
+				break
 			}
-			return longest
+		}
+		if hasArtifact {
+			continue
+		}
+		if m = bytes.TrimSpace(m); len(m) > 2 && len(m) > len(longest) {
+			longest = m
 		}
 	}
-
-	return ""
+	return string(longest)
 }
 
+// cleanPrintable drops non-printable characters, keeping newlines and tabs.
+// Message text is mostly ASCII, which is filtered byte-by-byte; only
+// multi-byte sequences are decoded and checked with unicode.IsPrint.
 func cleanPrintable(s string) string {
+	// Return s unchanged (without copying) if there is nothing to drop
+	i := 0
+	for i < len(s) && isPrintableASCII(s[i]) {
+		i++
+	}
+	if i == len(s) {
+		return s
+	}
+
 	var result strings.Builder
-	for _, r := range s {
-		if unicode.IsPrint(r) || r == '\n' || r == '\t' {
+	result.Grow(len(s))
+	result.WriteString(s[:i])
+	for i < len(s) {
+		c := s[i]
+		if c < utf8.RuneSelf {
+			if isPrintableASCII(c) {
+				result.WriteByte(c)
+			}
+			i++
+			continue
+		}
+		r, size := utf8.DecodeRuneInString(s[i:])
+		if unicode.IsPrint(r) {
 			result.WriteRune(r)
 		}
+		i += size
 	}
 	return result.String()
 }
 
+func isPrintableASCII(c byte) bool {
+	return (c >= 0x20 && c < 0x7F) || c == '\n' || c == '\t'
+}
+
 // GetConversations retrieves a list of recent conversations.
 func GetConversations(limit int) ([]Conversation, error) {
 	db, err := DB()
@@ -253,31 +407,50 @@ func GetConversations(limit int) ([]Conversation, error) {
 		return nil, err
 	}
 
+	// Pick the most recent chats first, then fetch participants for just
+	// those. Joining messages and handles in one GROUP BY multiplied every
+	// message of a chat by its participant count before aggregating.
 	query := `
-		SELECT 
+		WITH recent AS (
+			SELECT
+				c.ROWID as chat_id,
+				MAX(m.date) as last_message_date
+			FROM chat c
+			LEFT JOIN chat_message_join cmj ON c.ROWID = cmj.chat_id
+			LEFT JOIN message m ON cmj.message_id = m.ROWID
+			GROUP BY c.ROWID
+			ORDER BY last_message_date DESC
+			LIMIT ?
+		)
+		SELECT
 			c.ROWID as chat_id,
 			c.chat_identifier,
 			c.display_name,
 			c.service_name,
-			MAX(m.date) as last_message_date,
-			GROUP_CONCAT(DISTINCT h.id) as participants
-		FROM chat c
-		LEFT JOIN chat_message_join cmj ON c.ROWID = cmj.chat_id
-		LEFT JOIN message m ON cmj.message_id = m.ROWID
-		LEFT JOIN chat_handle_join chj ON c.ROWID = chj.chat_id
-		LEFT JOIN handle h ON chj.handle_id = h.ROWID
-		GROUP BY c.ROWID
-		ORDER BY last_message_date DESC
-		LIMIT ?
+			r.last_message_date,
+			(
+				SELECT GROUP_CONCAT(DISTINCT h.id)
+				FROM chat_handle_join chj
+				JOIN handle h ON chj.handle_id = h.ROWID
+				WHERE chj.chat_id = c.ROWID
+			) as participants
+		FROM recent r
+		JOIN chat c ON c.ROWID = r.chat_id
+		ORDER BY r.last_message_date DESC
 	`
 
-	rows, err := db.Query(query, limit)
+	stmt, err := prepared(db, query)
+	if err != nil {
+		return nil, err
+	}
+
+	rows, err := stmt.Query(limit)
 	if err != nil {
 		return nil, err
 	}
 	defer rows.Close()
 
-	var conversations []Conversation
+	conversations := make([]Conversation, 0, resultCap(limit))
 	for rows.Next() {
 		var c Conversation
 		var chatIdentifier, displayName, service sql.NullString
@@ -315,58 +488,102 @@ func GetConversations(limit int) ([]Conversation, error) {
 	return conversations, nil
 }
 
+// AttributedBodyColumn selects attributedBody (from a message table aliased
+// m) only for messages without a plain text column, the only case where it
+// is decoded. The blob often runs to kilobytes and spills onto overflow
+// pages, so SQLite then skips reading and copying it for most rows. It is
+// exported so the watcher's queries select the blob the same way.
+const AttributedBodyColumn = "CASE WHEN m.text IS NULL OR m.text = '' THEN m.attributedBody END"
+
+// getMessagesQuery serves lookups by chat ID and by chat identifier, with or
+// without a date or ROWID bound, so a single prepared statement covers them all.
+// Messages with no date are never excluded by the date bound.
+const getMessagesQuery = `
+	SELECT
+		m.ROWID as message_id,
+		m.text,
+		` + AttributedBodyColumn + ` as attributedBody,
+		m.date,
+		m.is_from_me,
+		m.is_read,
+		m.service,
+		h.id as sender_id,
+		c.ROWID as chat_id,
+		c.chat_identifier,
+		c.display_name
+	FROM message m
+	LEFT JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
+	LEFT JOIN chat c ON cmj.chat_id = c.ROWID
+	LEFT JOIN handle h ON m.handle_id = h.ROWID
+	WHERE c.ROWID IN (SELECT ROWID FROM chat WHERE ROWID = ? OR chat_identifier = ?)
+		AND (m.date < ? OR m.date IS NULL)
+		AND m.ROWID > ?
+	ORDER BY m.date DESC
+	LIMIT ?
+`
+
 // GetMessages retrieves messages from a specific conversation.
 func GetMessages(chatID int64, chatIdentifier string, limit int) ([]Message, error) {
+	return GetMessagesBefore(chatID, chatIdentifier, time.Time{}, limit)
+}
+
+// GetMessagesBefore retrieves up to limit messages from a conversation sent
+// before the given time, for paging back through history. A zero before
+// returns the newest messages. Undated messages are always included.
+func GetMessagesBefore(chatID int64, chatIdentifier string, before time.Time, limit int) ([]Message, error) {
+	maxDate := int64(math.MaxInt64)
+	if !before.IsZero() {
+		maxDate = TimeToAppleTime(before)
+	}
+	return getMessages(chatID, chatIdentifier, maxDate, 0, limit)
+}
+
+// GetMessagesSince retrieves up to limit of the newest messages in a
+// conversation with a ROWID greater than afterID, so a caller holding a
+// conversation's messages can fetch only what arrived since.
+func GetMessagesSince(chatID int64, chatIdentifier string, afterID int64, limit int) ([]Message, error) {
+	return getMessages(chatID, chatIdentifier, math.MaxInt64, afterID, limit)
+}
+
+// getMessages runs getMessagesQuery for messages dated before maxDate with a
+// ROWID greater than afterID, returning them oldest first.
+func getMessages(chatID int64, chatIdentifier string, maxDate, afterID int64, limit int) ([]Message, error) {
 	db, err := DB()
 	if err != nil {
 		return nil, err
 	}
 
-	var whereClause string
-	var whereParam interface{}
-	if chatID > 0 {
-		whereClause = "c.ROWID = ?"
-		whereParam = chatID
-	} else if chatIdentifier != "" {
-		whereClause = "c.chat_identifier = ?"
-		whereParam = chatIdentifier
-	} else {
-		return nil, fmt.Errorf("must provide either chat_id or chat_identifier")
+	// A chat ID takes precedence; the identifier is bound as NULL so it
+	// matches nothing. Without an ID, ROWID 0 matches nothing instead.
+	var identParam interface{}
+	if chatID <= 0 {
+		if chatIdentifier == "" {
+			return nil, fmt.Errorf("must provide either chat_id or chat_identifier")
+		}
+		chatID = 0
+		identParam = chatIdentifier
 	}
 
-	query := fmt.Sprintf(`
-		SELECT 
-			m.ROWID as message_id,
-			m.text,
-			m.attributedBody,
-			m.date,
-			m.is_from_me,
-			m.is_read,
-			m.service,
-			h.id as sender_id,
-			c.ROWID as chat_id,
-			c.chat_identifier,
-			c.display_name
-		FROM message m
-		LEFT JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
-		LEFT JOIN chat c ON cmj.chat_id = c.ROWID
-		LEFT JOIN handle h ON m.handle_id = h.ROWID
-		WHERE %s
-		ORDER BY m.date DESC
-		LIMIT ?
-	`, whereClause)
+	stmt, err := prepared(db, getMessagesQuery)
+	if err != nil {
+		return nil, err
+	}
 
-	rows, err := db.Query(query, whereParam, limit)
+	rows, err := stmt.Query(chatID, identParam, maxDate, afterID, limit)
 	if err != nil {
 		return nil, err
 	}
 	defer rows.Close()
 
-	var messages []Message
+	messages := make([]Message, 0, resultCap(limit))
+	names := make(nameLookup)
 	for rows.Next() {
 		var m Message
 		var text, senderID, chatIdent, chatName sql.NullString
-		var attributedBody []byte
+		// RawBytes borrows the driver's buffer instead of copying the blob;
+		// it is only valid until the next rows.Next, and is only decoded
+		// when the text column is empty.
+		var attributedBody sql.RawBytes
 		var date sql.NullInt64
 		var isFromMe, isRead int
 		var service sql.NullString
@@ -396,11 +613,11 @@ func GetMessages(chatID int64, chatIdentifier string, limit int) ([]Message, err
 		}
 
 		// Resolve sender
-		m.Sender = ResolveSender(m.IsFromMe, senderID.String)
+		m.Sender = names.sender(m.IsFromMe, senderID.String)
 
 		// Resolve chat name
 		if m.ChatName == "" {
-			m.ChatName = GetContactName(m.ChatIdent)
+			m.ChatName = names.name(m.ChatIdent)
 		}
 
 		messages = append(messages, m)
@@ -432,16 +649,51 @@ func GetMessages(chatID int64, chatIdentifier string, limit int) ([]Message, err
 
 // SearchMessages searches for messages containing the given text.
 func SearchMessages(query string, limit int) ([]Message, error) {
+	return SearchMessagesSince(query, time.Time{}, limit)
+}
+
+// SearchMessagesSince searches for messages containing the given text that
+// were sent after since. A zero since searches the whole history.
+func SearchMessagesSince(query string, since time.Time, limit int) ([]Message, error) {
 	db, err := DB()
 	if err != nil {
 		return nil, err
 	}
 
-	sqlQuery := `
-		SELECT 
+	minDate := int64(math.MinInt64)
+	if !since.IsZero() {
+		minDate = TimeToAppleTime(since)
+	}
+
+	// Prefer the full-text index; it narrows the search to a handful of
+	// ROWIDs instead of scanning every message body with LIKE.
+	if results, ok := searchIndexed(db, query, minDate, limit); ok {
+		return results, nil
+	}
+
+	searchPattern := "%" + query + "%"
+	whereClause := "(m.text LIKE ? OR CAST(m.attributedBody AS TEXT) LIKE ?)"
+	args := []interface{}{searchPattern, searchPattern}
+	if !since.IsZero() {
+		// The date bound is checked first so the message date index limits
+		// the rows whose bodies are scanned. It is left off otherwise, since
+		// it would also drop messages with no date.
+		whereClause = "m.date >= ? AND " + whereClause
+		args = append([]interface{}{minDate}, args...)
+	}
+	return searchMessageRows(db, whereClause, args, limit)
+}
+
+// searchMessageRows returns up to limit messages matching whereClause,
+// newest first, in the form search results are shown.
+func searchMessageRows(db *sql.DB, whereClause string, args []interface{}, limit int) ([]Message, error) {
+	args = append(args, limit)
+
+	sqlQuery := fmt.Sprintf(`
+		SELECT
 			m.ROWID as message_id,
 			m.text,
-			m.attributedBody,
+			%s as attributedBody,
 			m.date,
 			m.is_from_me,
 			c.chat_identifier,
@@ -451,23 +703,23 @@ func SearchMessages(query string, limit int) ([]Message, error) {
 		LEFT JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
 		LEFT JOIN chat c ON cmj.chat_id = c.ROWID
 		LEFT JOIN handle h ON m.handle_id = h.ROWID
-		WHERE m.text LIKE ? OR CAST(m.attributedBody AS TEXT) LIKE ?
+		WHERE %s
 		ORDER BY m.date DESC
 		LIMIT ?
-	`
+	`, AttributedBodyColumn, whereClause)
 
-	searchPattern := "%" + query + "%"
-	rows, err := db.Query(sqlQuery, searchPattern, searchPattern, limit)
+	rows, err := db.Query(sqlQuery, args...)
 	if err != nil {
 		return nil, err
 	}
 	defer rows.Close()
 
-	var results []Message
+	results := make([]Message, 0, resultCap(limit))
+	names := make(nameLookup)
 	for rows.Next() {
 		var m Message
 		var text, chatIdent, chatName, senderID sql.NullString
-		var attributedBody []byte
+		var attributedBody sql.RawBytes
 		var date sql.NullInt64
 		var isFromMe int
 
@@ -492,10 +744,10 @@ func SearchMessages(query string, limit int) ([]Message, error) {
 			m.Text = "[Attachment]"
 		}
 
-		m.Sender = ResolveSender(m.IsFromMe, senderID.String)
+		m.Sender = names.sender(m.IsFromMe, senderID.String)
 
 		if m.ChatName == "" {
-			m.ChatName = GetContactName(m.ChatIdent)
+			m.ChatName = names.name(m.ChatIdent)
 		}
 
 		results = append(results, m)
@@ -521,31 +773,46 @@ func GetUnreadCount() (int, error) {
 	return count, err
 }
 
-// GetContactByIdentifier looks up a contact by phone number or email.
+// GetConversationCount returns the total number of conversations.
+func GetConversationCount() (int, error) {
+	db, err := DB()
+	if err != nil {
+		return 0, err
+	}
+
+	var count int
+	err = db.QueryRow("SELECT COUNT(*) FROM chat").Scan(&count)
+	return count, err
+}
+
+// GetContactByIdentifier looks up a contact by phone number or email. The
+// returned Conversation carries the matching handle ID as ChatIdentifier
+// (which is the chat identifier of the one-to-one chat with that handle)
+// and the contact name as DisplayName.
 func GetContactByIdentifier(identifier string) (*Conversation, error) {
 	db, err := DB()
 	if err != nil {
 		return nil, err
 	}
 
-	// Normalize identifier
-	normalized := normalizeIdentifier(identifier)
+	// An exact handle match wins; otherwise fall back to a substring match on
+	// the raw or normalized identifier. A name like "john" normalizes to "",
+	// which must not become a match-everything '%%' pattern.
+	pattern := "%" + identifier + "%"
+	normalizedPattern := pattern
+	if normalized := normalizeIdentifier(identifier); normalized != "" {
+		normalizedPattern = "%" + normalized + "%"
+	}
 
 	var c Conversation
-	var chatIdent, displayName, service sql.NullString
-
+	var service sql.NullString
 	err = db.QueryRow(`
-		SELECT DISTINCT 
-			h.id as identifier,
-			h.service,
-			c.chat_identifier,
-			c.display_name
-		FROM handle h
-		LEFT JOIN chat_handle_join chj ON h.ROWID = chj.handle_id
-		LEFT JOIN chat c ON chj.chat_id = c.ROWID
-		WHERE h.id LIKE ? OR h.id LIKE ?
+		SELECT id, service
+		FROM handle
+		WHERE id = ? OR id LIKE ? OR id LIKE ?
+		ORDER BY id = ? DESC
 		LIMIT 1
-	`, "%"+identifier+"%", "%"+normalized+"%").Scan(&chatIdent, &service, &c.ChatIdentifier, &displayName)
+	`, identifier, pattern, normalizedPattern, identifier).Scan(&c.ChatIdentifier, &service)
 
 	if err == sql.ErrNoRows {
 		return nil, nil
@@ -554,13 +821,33 @@ func GetContactByIdentifier(identifier string) (*Conversation, error) {
 		return nil, err
 	}
 
-	c.DisplayName = displayName.String
 	c.Service = service.String
+	c.DisplayName = GetContactName(c.ChatIdentifier)
 
 	return &c, nil
 }
 
+// normalizeIdentifier keeps only the digits and the '+', '@' and '.'
+// characters of identifier. ASCII input is filtered byte-by-byte; only
+// identifiers containing other characters take the rune-aware path.
 func normalizeIdentifier(identifier string) string {
+	buf := make([]byte, 0, len(identifier))
+	for i := 0; i < len(identifier); i++ {
+		c := identifier[i]
+		if c >= utf8.RuneSelf {
+			return normalizeIdentifierRunes(identifier)
+		}
+		if (c >= '0' && c <= '9') || c == '+' || c == '@' || c == '.' {
+			buf = append(buf, c)
+		}
+	}
+	if len(buf) == len(identifier) {
+		return identifier
+	}
+	return string(buf)
+}
+
+func normalizeIdentifierRunes(identifier string) string {
 	var result strings.Builder
 	for _, c := range identifier {
 		if unicode.IsDigit(c) || c == '+' || c == '@' || c == '.' {
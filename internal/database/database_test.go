@@ -0,0 +1,197 @@
+package database
+
+import (
+	"database/sql"
+	"math"
+	"testing"
+	"time"
+)
+
+func TestResultCap(t *testing.T) {
+	tests := []struct {
+		limit int
+		want  int
+	}{
+		{-1, 0},
+		{0, 0},
+		{50, 50},
+		{maxResultCap, maxResultCap},
+		{100000000, maxResultCap},
+	}
+	for _, tt := range tests {
+		if got := resultCap(tt.limit); got != tt.want {
+			t.Errorf("resultCap(%d) = %d, want %d", tt.limit, got, tt.want)
+		}
+	}
+}
+
+func TestNormalizeIdentifier(t *testing.T) {
+	tests := []struct {
+		in, want string
+	}{
+		{"", ""},
+		{"+15551234567", "+15551234567"},
+		{"+1 (555) 123-4567", "+15551234567"},
+		{"a.b@c.com", ".@."},
+		{"٣+x", "٣+"},
+	}
+	for _, tt := range tests {
+		if got := normalizeIdentifier(tt.in); got != tt.want {
+			t.Errorf("normalizeIdentifier(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
+
+func TestAppleTimeToTime(t *testing.T) {
+	if got := AppleTimeToTime(0); got != nil {
+		t.Errorf("AppleTimeToTime(0) = %v, want nil", got)
+	}
+
+	tests := []struct {
+		name      string
+		appleTime int64
+		want      time.Time
+	}{
+		{"seconds", 1, time.Unix(appleEpochOffset+1, 0)},
+		{"seconds at threshold", 1e9, time.Unix(appleEpochOffset+1e9, 0)},
+		{"nanoseconds", 700000000 * int64(time.Second), time.Unix(appleEpochOffset+700000000, 0)},
+		{"nanoseconds truncated", 700000000*int64(time.Second) + 999, time.Unix(appleEpochOffset+700000000, 0)},
+	}
+	for _, tt := range tests {
+		got := AppleTimeToTime(tt.appleTime)
+		if got == nil || !got.Equal(tt.want) {
+			t.Errorf("%s: AppleTimeToTime(%d) = %v, want %v", tt.name, tt.appleTime, got, tt.want)
+		}
+	}
+
+	now := time.Unix(1700000000, 0)
+	if got := AppleTimeToTime(TimeToAppleTime(now)); got == nil || !got.Equal(now) {
+		t.Errorf("round trip of %v = %v", now, got)
+	}
+}
+
+func TestCleanPrintable(t *testing.T) {
+	tests := []struct {
+		in, want string
+	}{
+		{"", ""},
+		{"plain text", "plain text"},
+		{"a\x00b\tc\n", "ab\tc\n"},
+		{"héllo\x01 wörld", "héllo wörld"},
+		{"\x7f\x1b", ""},
+	}
+	for _, tt := range tests {
+		if got := cleanPrintable(tt.in); got != tt.want {
+			t.Errorf("cleanPrintable(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
+
+func TestExtractTextFromAttributedBody(t *testing.T) {
+	tests := []struct {
+		name string
+		data string
+		want string
+	}{
+		{"empty", "", ""},
+		{
+			"between markers, serialization bytes trimmed",
+			"\x04\x0bNSString\x01\x02\x03\x04\x05\x06Hello world" + "\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01" + "NSDictionary\x00NSNumber",
+			"Hello world",
+		},
+		{"between markers, short text kept whole", "NSStringHeyNSDictionaryNSNumber", "Hey"},
+		{"streamtyped", "\x04\x0bstreamtyped\x00NSString\x01\x02Hello there\x03NSArray", "Hello there"},
+		{"longest readable run", "\x00\x01bplist00\x00Hi\x00Lunch at noon?\x00\x01", "Lunch at noon?"},
+		{"only artifacts", "\x00bplist00\x00NSData\x00", ""},
+	}
+	for _, tt := range tests {
+		if got := ExtractTextFromAttributedBody([]byte(tt.data)); got != tt.want {
+			t.Errorf("%s: got %q, want %q", tt.name, got, tt.want)
+		}
+	}
+}
+
+// openFixtureDB returns an in-memory database with the parts of the chat.db
+// schema that getMessagesQuery reads.
+func openFixtureDB(t *testing.T) *sql.DB {
+	t.Helper()
+
+	db, err := sql.Open("sqlite3", ":memory:")
+	if err != nil {
+		t.Fatal(err)
+	}
+	// Every connection to :memory: is a separate database
+	db.SetMaxOpenConns(1)
+	t.Cleanup(func() { db.Close() })
+
+	_, err = db.Exec(`
+		CREATE TABLE chat (ROWID INTEGER PRIMARY KEY, chat_identifier TEXT, display_name TEXT, service_name TEXT);
+		CREATE TABLE handle (ROWID INTEGER PRIMARY KEY, id TEXT);
+		CREATE TABLE message (ROWID INTEGER PRIMARY KEY, text TEXT, attributedBody BLOB, date INTEGER,
+			is_from_me INTEGER, is_read INTEGER, service TEXT, handle_id INTEGER);
+		CREATE TABLE chat_message_join (chat_id INTEGER, message_id INTEGER);
+
+		INSERT INTO chat VALUES (1, '+15551234567', '', 'iMessage'), (2, 'other@example.com', '', 'iMessage');
+		INSERT INTO handle VALUES (1, '+15551234567');
+		INSERT INTO message VALUES
+			(1, 'first', NULL, 100, 0, 1, 'iMessage', 1),
+			(2, 'undated', NULL, NULL, 0, 1, 'iMessage', 1),
+			(3, 'third', NULL, 300, 1, 1, 'iMessage', 0),
+			(4, 'elsewhere', NULL, 400, 0, 1, 'iMessage', 0);
+		INSERT INTO chat_message_join VALUES (1, 1), (1, 2), (1, 3), (2, 4);
+	`)
+	if err != nil {
+		t.Fatal(err)
+	}
+	return db
+}
+
+func TestGetMessagesQuery(t *testing.T) {
+	db := openFixtureDB(t)
+
+	tests := []struct {
+		name       string
+		chatID     int64
+		identifier interface{}
+		maxDate    int64
+		afterID    int64
+		want       []int64
+	}{
+		{"by chat ID, unbounded", 1, nil, math.MaxInt64, 0, []int64{3, 1, 2}},
+		{"by identifier", 0, "+15551234567", math.MaxInt64, 0, []int64{3, 1, 2}},
+		{"before a date keeps undated", 1, nil, 300, 0, []int64{1, 2}},
+		{"after an ID", 1, nil, math.MaxInt64, 1, []int64{3, 2}},
+		{"other chat", 2, nil, math.MaxInt64, 0, []int64{4}},
+		{"unknown chat", 9, nil, math.MaxInt64, 0, nil},
+	}
+	for _, tt := range tests {
+		rows, err := db.Query(getMessagesQuery, tt.chatID, tt.identifier, tt.maxDate, tt.afterID, 10)
+		if err != nil {
+			t.Fatalf("%s: %v", tt.name, err)
+		}
+		var got []int64
+		for rows.Next() {
+			var id int64
+			var text, sender, chatIdent, chatName, service sql.NullString
+			var body []byte
+			var date, chatID sql.NullInt64
+			var isFromMe, isRead int
+			if err := rows.Scan(&id, &text, &body, &date, &isFromMe, &isRead, &service, &sender, &chatID, &chatIdent, &chatName); err != nil {
+				t.Fatalf("%s: %v", tt.name, err)
+			}
+			got = append(got, id)
+		}
+		rows.Close()
+
+		if len(got) != len(tt.want) {
+			t.Errorf("%s: got IDs %v, want %v", tt.name, got, tt.want)
+			continue
+		}
+		for i := range got {
+			if got[i] != tt.want[i] {
+				t.Errorf("%s: got IDs %v, want %v", tt.name, got, tt.want)
+				break
+			}
+		}
+	}
+}
@@ -0,0 +1,424 @@
+// This file holds the full-text search index for iMessage text.
+
+package database
+
+import (
+	"database/sql"
+	"math"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"time"
+	"unicode"
+)
+
+// The search index is a sidecar SQLite database holding an FTS4 table of
+// message text keyed by chat.db message ROWID. chat.db itself is opened
+// read-only, so the index lives in the user cache directory and is brought
+// up to date incrementally (by ROWID) before each search.
+var (
+	searchIndex     *sql.DB
+	searchIndexOnce sync.Once
+	searchIndexErr  error
+	// searchIndexMu serializes incremental index updates
+	searchIndexMu sync.Mutex
+)
+
+const searchIndexSchema = `
+	CREATE VIRTUAL TABLE IF NOT EXISTS message_fts USING fts4(text, date, notindexed=date, tokenize=unicode61);
+	CREATE TABLE IF NOT EXISTS index_state (id INTEGER PRIMARY KEY CHECK (id = 1), last_rowid INTEGER NOT NULL);
+	INSERT OR IGNORE INTO index_state (id, last_rowid) VALUES (1, 0);
+	CREATE TABLE IF NOT EXISTS index_synced (id INTEGER PRIMARY KEY CHECK (id = 1), synced_at INTEGER NOT NULL);
+	INSERT OR IGNORE INTO index_synced (id, synced_at) VALUES (1, 0);
+`
+
+// editWindow is how long after sending a message can still be edited or
+// unsent in Messages.
+const editWindow = 15 * time.Minute
+
+// getSearchIndexPath returns the location of the search index database.
+func getSearchIndexPath() string {
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		return ""
+	}
+	return filepath.Join(dir, "imessage-cli", "search.db")
+}
+
+// searchIndexDB returns the lazily opened search index database.
+func searchIndexDB() (*sql.DB, error) {
+	searchIndexOnce.Do(func() {
+		path := getSearchIndexPath()
+		if path == "" {
+			searchIndexErr = os.ErrNotExist
+			return
+		}
+		if err := os.MkdirAll(filepath.Dir(path), 0700); err != nil {
+			searchIndexErr = err
+			return
+		}
+
+		// Create the file up front so it is private to the user; it holds a
+		// copy of message text.
+		f, err := os.OpenFile(path, os.O_CREATE|os.O_RDWR, 0600)
+		if err != nil {
+			searchIndexErr = err
+			return
+		}
+		f.Close()
+
+		db, err := sql.Open("sqlite3", "file:"+path+"?_busy_timeout=3000&_journal_mode=WAL")
+		if err != nil {
+			searchIndexErr = err
+			return
+		}
+		db.SetMaxOpenConns(1)
+
+		if _, err := db.Exec(searchIndexSchema); err != nil {
+			db.Close()
+			searchIndexErr = err
+			return
+		}
+		searchIndex = db
+	})
+	return searchIndex, searchIndexErr
+}
+
+// closeSearchIndex closes the search index database if it was opened.
+func closeSearchIndex() {
+	if searchIndex != nil {
+		searchIndex.Close()
+		searchIndex = nil
+	}
+}
+
+// updateSearchIndex indexes every chat.db message added since the last
+// update. Messages can still be edited or unsent for editWindow after they
+// are sent, so indexed messages sent within editWindow of the last update
+// are indexed again from their current text.
+func updateSearchIndex(chatDB, idx *sql.DB) error {
+	searchIndexMu.Lock()
+	defer searchIndexMu.Unlock()
+
+	now := TimeToAppleTime(time.Now())
+
+	var lastID, syncedAt int64
+	if err := idx.QueryRow("SELECT s.last_rowid, t.synced_at FROM index_state s, index_synced t").Scan(&lastID, &syncedAt); err != nil {
+		return err
+	}
+
+	var maxID sql.NullInt64
+	if err := chatDB.QueryRow("SELECT MAX(ROWID) FROM message").Scan(&maxID); err != nil {
+		return err
+	}
+
+	tx, err := idx.Begin()
+	if err != nil {
+		return err
+	}
+	defer tx.Rollback()
+
+	// chat.db was replaced (e.g. restored from backup); ROWIDs no longer line up
+	if maxID.Int64 < lastID {
+		if _, err := tx.Exec("DELETE FROM message_fts"); err != nil {
+			return err
+		}
+		lastID = 0
+	}
+
+	remove, err := tx.Prepare("DELETE FROM message_fts WHERE docid = ?")
+	if err != nil {
+		return err
+	}
+	defer remove.Close()
+
+	insert, err := tx.Prepare("INSERT INTO message_fts (docid, text, date) VALUES (?, ?, ?)")
+	if err != nil {
+		return err
+	}
+	defer insert.Close()
+
+	// The date bound is served by chat.db's message date index, so this
+	// reads only the last few minutes of messages on a typical update. The
+	// unary + keeps the planner from scanning the ROWID range instead.
+	recent, err := chatDB.Query(`
+		SELECT m.ROWID, m.text, `+AttributedBodyColumn+`, m.date
+		FROM message m
+		WHERE m.date >= ? AND +m.ROWID <= ?
+	`, syncedAt-int64(editWindow), lastID)
+	if err != nil {
+		return err
+	}
+	err = indexRows(recent, func(rowID int64, body string, date int64) error {
+		if _, err := remove.Exec(rowID); err != nil {
+			return err
+		}
+		if body == "" {
+			return nil
+		}
+		_, err := insert.Exec(rowID, body, date)
+		return err
+	})
+	if err != nil {
+		return err
+	}
+
+	if maxID.Int64 > lastID {
+		added, err := chatDB.Query(`
+			SELECT m.ROWID, m.text, `+AttributedBodyColumn+`, m.date
+			FROM message m
+			WHERE m.ROWID > ?
+			ORDER BY m.ROWID
+		`, lastID)
+		if err != nil {
+			return err
+		}
+		err = indexRows(added, func(rowID int64, body string, date int64) error {
+			lastID = rowID
+			if body == "" {
+				return nil
+			}
+			_, err := insert.Exec(rowID, body, date)
+			return err
+		})
+		if err != nil {
+			return err
+		}
+	}
+
+	if _, err := tx.Exec("UPDATE index_state SET last_rowid = ? WHERE id = 1", lastID); err != nil {
+		return err
+	}
+	if _, err := tx.Exec("UPDATE index_synced SET synced_at = ? WHERE id = 1", now); err != nil {
+		return err
+	}
+	return tx.Commit()
+}
+
+// indexRows calls fn with the ROWID, searchable text and date of each
+// message row (ROWID, text, attributedBody, date), then closes rows. The
+// text is empty for messages with nothing to index.
+func indexRows(rows *sql.Rows, fn func(rowID int64, body string, date int64) error) error {
+	defer rows.Close()
+
+	for rows.Next() {
+		var rowID int64
+		var text sql.NullString
+		var attributedBody sql.RawBytes
+		var date sql.NullInt64
+		if err := rows.Scan(&rowID, &text, &attributedBody, &date); err != nil {
+			continue
+		}
+
+		body := text.String
+		if body == "" && len(attributedBody) > 0 {
+			body = ExtractTextFromAttributedBody(attributedBody)
+		}
+		if err := fn(rowID, body, date.Int64); err != nil {
+			return err
+		}
+	}
+	return rows.Err()
+}
+
+// buildMatchQuery turns free text into an FTS query that requires every word
+// to appear as a word prefix, so "meet tom" finds "Meeting with Tommy". The
+// unicode61 tokenizer indexes only letters and numbers, so a word without
+// any (an emoji, punctuation) could never match; the result is empty in that
+// case and the caller falls back to a substring scan.
+func buildMatchQuery(query string) string {
+	var terms []string
+	for _, word := range strings.Fields(query) {
+		word = strings.ReplaceAll(word, `"`, "")
+		if word == "" {
+			continue
+		}
+		if !strings.ContainsFunc(word, isTokenRune) {
+			return ""
+		}
+		terms = append(terms, `"`+word+`*"`)
+	}
+	return strings.Join(terms, " ")
+}
+
+// isTokenRune reports whether the unicode61 tokenizer keeps r in a token.
+func isTokenRune(r rune) bool {
+	return unicode.IsLetter(r) || unicode.IsNumber(r)
+}
+
+// SearchIndexBuilt reports whether the search index already holds messages.
+// The first search indexes the whole of chat.db, which can take a while on
+// a large history, so callers can warn before it starts.
+func SearchIndexBuilt() bool {
+	idx, err := searchIndexDB()
+	if err != nil {
+		// Search will fall back to scanning; there is nothing to build
+		return true
+	}
+	var lastID int64
+	if err := idx.QueryRow("SELECT last_rowid FROM index_state WHERE id = 1").Scan(&lastID); err != nil {
+		return true
+	}
+	return lastID > 0
+}
+
+// searchPageSize is how many index hits are resolved against chat.db at a
+// time. It keeps each ROWID IN (...) list well under SQLite's bound
+// parameter limit however large the requested limit is.
+const searchPageSize = 200
+
+// indexHit is a message matched in the index, with the text it was
+// indexed under.
+type indexHit struct {
+	id   int64
+	date int64
+	text string
+}
+
+// searchIndexed returns up to limit messages matching query with a date of
+// at least minDate, newest first, found through the index. A negative limit
+// returns every match. ok is false when the index is unavailable, the query
+// has nothing the index can match, or no live message matched; the caller
+// then falls back to scanning chat.db, which also catches text the
+// tokenizer splits differently.
+//
+// The index only ever appends new ROWIDs, so hits are checked against
+// chat.db page by page: hits whose message was deleted, or whose text no
+// longer matches what was indexed (edited or unsent), are corrected in the
+// index and skipped unless their current text still matches. Paging
+// continues until limit live matches are found, so stale entries never use
+// up result slots.
+func searchIndexed(chatDB *sql.DB, query string, minDate int64, limit int) (results []Message, ok bool) {
+	match := buildMatchQuery(query)
+	if match == "" {
+		return nil, false
+	}
+
+	idx, err := searchIndexDB()
+	if err != nil {
+		return nil, false
+	}
+	if err := updateSearchIndex(chatDB, idx); err != nil {
+		return nil, false
+	}
+
+	results = make([]Message, 0, resultCap(limit))
+	if limit == 0 {
+		return results, true
+	}
+
+	cursorDate, cursorID := int64(math.MaxInt64), int64(math.MaxInt64)
+	for {
+		hits, err := searchIndexPage(idx, match, minDate, cursorDate, cursorID)
+		if err != nil {
+			return nil, false
+		}
+		if len(hits) == 0 {
+			break
+		}
+		last := hits[len(hits)-1]
+		cursorDate, cursorID = last.date, last.id
+
+		live, err := messagesByID(chatDB, hits)
+		if err != nil {
+			return nil, false
+		}
+
+		for _, hit := range hits {
+			m, found := live[hit.id]
+			if !found || m.Text != hit.text {
+				body := ""
+				// "[Attachment]" stands in for a message without text
+				if found && m.Text != "[Attachment]" {
+					body = m.Text
+				}
+				if !reindexMessage(idx, hit.id, body, match) {
+					continue
+				}
+			}
+			results = append(results, m)
+			if limit > 0 && len(results) == limit {
+				return results, true
+			}
+		}
+
+		if len(hits) < searchPageSize {
+			break
+		}
+	}
+	return results, len(results) > 0
+}
+
+// searchIndexPage returns the next page of index hits for match, newest
+// first, starting after the hit at (cursorDate, cursorID). The rows are read
+// in full before returning, since the index's single connection is needed
+// again to correct stale entries.
+func searchIndexPage(idx *sql.DB, match string, minDate, cursorDate, cursorID int64) ([]indexHit, error) {
+	// Undated messages are indexed with date 0, so they pass the unbounded
+	// minDate (math.MinInt64) used when no --days is given.
+	rows, err := idx.Query(`
+		SELECT docid, date, text
+		FROM message_fts
+		WHERE message_fts MATCH ? AND date >= ?
+			AND (date < ? OR (date = ? AND docid < ?))
+		ORDER BY date DESC, docid DESC
+		LIMIT ?
+	`, match, minDate, cursorDate, cursorDate, cursorID, searchPageSize)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+
+	hits := make([]indexHit, 0, searchPageSize)
+	for rows.Next() {
+		var hit indexHit
+		if err := rows.Scan(&hit.id, &hit.date, &hit.text); err != nil {
+			continue
+		}
+		hits = append(hits, hit)
+	}
+	return hits, rows.Err()
+}
+
+// messagesByID fetches the chat.db messages for hits, keyed by ROWID.
+// Messages that no longer exist are absent from the map.
+func messagesByID(chatDB *sql.DB, hits []indexHit) (map[int64]Message, error) {
+	placeholders := make([]string, len(hits))
+	args := make([]interface{}, len(hits))
+	for i, hit := range hits {
+		placeholders[i] = "?"
+		args[i] = hit.id
+	}
+
+	msgs, err := searchMessageRows(chatDB, "m.ROWID IN ("+strings.Join(placeholders, ",")+")", args, -1)
+	if err != nil {
+		return nil, err
+	}
+
+	byID := make(map[int64]Message, len(msgs))
+	for _, m := range msgs {
+		byID[m.MessageID] = m
+	}
+	return byID, nil
+}
+
+// reindexMessage brings a stale index entry in line with the message's
+// current text, removing it if the message is gone or has no text, and
+// reports whether the entry still matches match.
+func reindexMessage(idx *sql.DB, id int64, body, match string) bool {
+	searchIndexMu.Lock()
+	defer searchIndexMu.Unlock()
+
+	if body == "" {
+		idx.Exec("DELETE FROM message_fts WHERE docid = ?", id)
+		return false
+	}
+	if _, err := idx.Exec("UPDATE message_fts SET text = ? WHERE docid = ?", body, id); err != nil {
+		return false
+	}
+
+	var matches int
+	err := idx.QueryRow("SELECT COUNT(*) FROM message_fts WHERE docid = ? AND message_fts MATCH ?", id, match).Scan(&matches)
+	return err == nil && matches > 0
+}
@@ -0,0 +1,27 @@
+package database
+
+import "testing"
+
+func TestBuildMatchQuery(t *testing.T) {
+	tests := []struct {
+		in, want string
+	}{
+		{"", ""},
+		{"   ", ""},
+		{"meet", `"meet*"`},
+		{"meet  tom", `"meet*" "tom*"`},
+		{`say "hi"`, `"say*" "hi*"`},
+		{`"""`, ""},
+		{"don't", `"don't*"`},
+		{"café", `"café*"`},
+		// Words the tokenizer would drop leave nothing to match on
+		{"😀", ""},
+		{"-", ""},
+		{"hi 😀", ""},
+	}
+	for _, tt := range tests {
+		if got := buildMatchQuery(tt.in); got != tt.want {
+			t.Errorf("buildMatchQuery(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
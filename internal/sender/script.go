@@ -0,0 +1,76 @@
+// This file holds compiled AppleScript execution.
+
+package sender
+
+import (
+	"context"
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"sync"
+	"time"
+)
+
+// appleScript is an AppleScript whose source never changes; per-call values
+// are passed as arguments to its run handler. The source is compiled once
+// with osacompile into the user cache directory (named by a hash of the
+// source, so it is shared by later invocations), and runs execute the
+// compiled file so osascript skips parsing and compiling it every time.
+type appleScript struct {
+	source string
+	once   sync.Once
+	path   string // compiled script, empty if compilation failed
+}
+
+func newAppleScript(source string) *appleScript {
+	return &appleScript{source: source}
+}
+
+// compiled returns the path of the compiled script, compiling it on first use.
+func (s *appleScript) compiled() string {
+	s.once.Do(func() {
+		cacheDir, err := os.UserCacheDir()
+		if err != nil {
+			return
+		}
+		sum := sha256.Sum256([]byte(s.source))
+		dir := filepath.Join(cacheDir, "imessage-cli", "scripts")
+		path := filepath.Join(dir, hex.EncodeToString(sum[:8])+".scpt")
+
+		if _, err := os.Stat(path); err == nil {
+			s.path = path
+			return
+		}
+		if err := os.MkdirAll(dir, 0700); err != nil {
+			return
+		}
+
+		// Compile to a private name and rename, so a concurrent invocation
+		// never runs a partially written file.
+		tmp := filepath.Join(dir, fmt.Sprintf("%s.%d.scpt", hex.EncodeToString(sum[:8]), os.Getpid()))
+		ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+		defer cancel()
+		if err := exec.CommandContext(ctx, "osacompile", "-o", tmp, "-e", s.source).Run(); err != nil {
+			os.Remove(tmp)
+			return
+		}
+		if err := os.Rename(tmp, path); err != nil {
+			os.Remove(tmp)
+			return
+		}
+		s.path = path
+	})
+	return s.path
+}
+
+// command returns an osascript command running the script with args. If the
+// script could not be compiled, the source is passed with -e instead.
+func (s *appleScript) command(ctx context.Context, args ...string) *exec.Cmd {
+	if path := s.compiled(); path != "" {
+		return exec.CommandContext(ctx, "osascript", append([]string{path}, args...)...)
+	}
+	return exec.CommandContext(ctx, "osascript", append([]string{"-e", s.source}, args...)...)
+}
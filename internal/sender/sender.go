@@ -2,84 +2,49 @@
 package sender
 
 import (
+	"bytes"
 	"context"
 	"fmt"
-	"os/exec"
-	"strings"
 	"time"
 )
 
-// SendMessage sends an iMessage to a recipient.
-func SendMessage(recipient, message string) error {
-	escapedMessage := escapeForAppleScript(message)
-	escapedRecipient := escapeForAppleScript(recipient)
-
-	applescript := fmt.Sprintf(`
-		tell application "Messages"
+// sendScript tries three strategies in order, so a failed attempt falls
+// through to the next one without spawning another osascript process:
+//  1. send to the recipient as a buddy of the iMessage service
+//  2. send to the recipient as a participant of an existing chat
+//  3. send to the recipient as a participant of the iMessage account,
+//     which starts a new conversation
+//
+// The recipient and message arrive as arguments, so they are never
+// interpolated into the script source.
+var sendScript = newAppleScript(`
+on run argv
+	set theRecipient to item 1 of argv
+	set theMessage to item 2 of argv
+	tell application "Messages"
+		try
 			set targetService to 1st service whose service type = iMessage
-			set targetBuddy to buddy "%s" of targetService
-			send "%s" to targetBuddy
-		end tell
-	`, escapedRecipient, escapedMessage)
-
-	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
-	defer cancel()
-
-	cmd := exec.CommandContext(ctx, "osascript", "-e", applescript)
-	output, err := cmd.CombinedOutput()
-
-	if err != nil {
-		// Try alternative method
-		return sendMessageAlternative(recipient, message)
-	}
-
-	_ = output
-	return nil
-}
-
-// sendMessageAlternative is an alternative method to send message using chat specifier.
-func sendMessageAlternative(recipient, message string) error {
-	escapedMessage := escapeForAppleScript(message)
-	escapedRecipient := escapeForAppleScript(recipient)
-
-	applescript := fmt.Sprintf(`
-		tell application "Messages"
-			send "%s" to participant "%s" of (1st chat whose participants contains participant "%s")
-		end tell
-	`, escapedMessage, escapedRecipient, escapedRecipient)
-
-	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
-	defer cancel()
-
-	cmd := exec.CommandContext(ctx, "osascript", "-e", applescript)
-	_, err := cmd.CombinedOutput()
-
-	if err != nil {
-		return sendNewMessage(recipient, message)
-	}
-
-	return nil
-}
-
-// sendNewMessage sends a message by creating a new conversation.
-func sendNewMessage(recipient, message string) error {
-	escapedMessage := escapeForAppleScript(message)
-	escapedRecipient := escapeForAppleScript(recipient)
-
-	applescript := fmt.Sprintf(`
-		tell application "Messages"
-			set theBuddy to "%s"
-			set theMessage to "%s"
-			set theService to 1st account whose service type = iMessage
-			set theParticipant to participant theBuddy of theService
-			send theMessage to theParticipant
-		end tell
-	`, escapedRecipient, escapedMessage)
+			set targetBuddy to buddy theRecipient of targetService
+			send theMessage to targetBuddy
+		on error
+			try
+				send theMessage to participant theRecipient of (1st chat whose participants contains participant theRecipient)
+			on error
+				set theService to 1st account whose service type = iMessage
+				set theParticipant to participant theRecipient of theService
+				send theMessage to theParticipant
+			end try
+		end try
+	end tell
+end run
+`)
 
+// SendMessage sends an iMessage to a recipient.
+func SendMessage(recipient, message string) error {
 	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "osascript", "-e", applescript)
+	cmd := sendScript.command(ctx, recipient, message)
 	output, err := cmd.CombinedOutput()
 
 	if err != nil {
@@ -89,22 +54,24 @@ func sendNewMessage(recipient, message string) error {
 	return nil
 }
 
+// groupSendScript sends a message to the chat with the given name.
+var groupSendScript = newAppleScript(`
+on run argv
+	set theName to item 1 of argv
+	set theMessage to item 2 of argv
+	tell application "Messages"
+		set theChat to 1st chat whose name = theName
+		send theMessage to theChat
+	end tell
+end run
+`)
+
 // SendToGroup sends a message to a group chat by name.
 func SendToGroup(chatName, message string) error {
-	escapedMessage := escapeForAppleScript(message)
-	escapedName := escapeForAppleScript(chatName)
-
-	applescript := fmt.Sprintf(`
-		tell application "Messages"
-			set theChat to 1st chat whose name = "%s"
-			send "%s" to theChat
-		end tell
-	`, escapedName, escapedMessage)
-
 	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "osascript", "-e", applescript)
+	cmd := groupSendScript.command(ctx, chatName, message)
 	output, err := cmd.CombinedOutput()
 
 	if err != nil {
@@ -114,54 +81,43 @@ func SendToGroup(chatName, message string) error {
 	return nil
 }
 
+// messagesRunningScript reports whether the Messages process is running.
+var messagesRunningScript = newAppleScript(`
+tell application "System Events"
+	return (name of processes) contains "Messages"
+end tell
+`)
+
+// activateMessagesScript launches Messages or brings it to the front.
+var activateMessagesScript = newAppleScript(`
+tell application "Messages"
+	activate
+end tell
+`)
+
 // CheckMessagesRunning checks if the Messages app is running.
 func CheckMessagesRunning() bool {
-	applescript := `
-		tell application "System Events"
-			return (name of processes) contains "Messages"
-		end tell
-	`
-
 	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "osascript", "-e", applescript)
+	cmd := messagesRunningScript.command(ctx)
 	output, err := cmd.Output()
 
 	if err != nil {
 		return false
 	}
 
-	return strings.TrimSpace(strings.ToLower(string(output))) == "true"
+	return bytes.EqualFold(bytes.TrimSpace(output), []byte("true"))
 }
 
 // StartMessagesApp starts the Messages app if it's not running.
 func StartMessagesApp() bool {
-	applescript := `
-		tell application "Messages"
-			activate
-		end tell
-	`
-
 	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "osascript", "-e", applescript)
+	// Stdout and stderr stay nil, so output goes to /dev/null without pipes
+	cmd := activateMessagesScript.command(ctx)
 	err := cmd.Run()
 
 	return err == nil
 }
-
-func escapeForAppleScript(s string) string {
-	// Escape backslashes first (order matters)
-	s = strings.ReplaceAll(s, "\\", "\\\\")
-	// Escape double quotes
-	s = strings.ReplaceAll(s, "\"", "\\\"")
-	// Replace newlines with AppleScript line breaks
-	s = strings.ReplaceAll(s, "\n", "\" & return & \"")
-	// Replace carriage returns
-	s = strings.ReplaceAll(s, "\r", "")
-	// Replace tabs with spaces
-	s = strings.ReplaceAll(s, "\t", "    ")
-	return s
-}
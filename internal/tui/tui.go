@@ -3,6 +3,7 @@ package tui
 
 import (
 	"fmt"
+	"io"
 	"log"
 	"os"
 	"path/filepath"
@@ -11,10 +12,12 @@ import (
 	"sync/atomic"
 	"syscall"
 	"time"
+	"unicode/utf8"
 
 	"github.com/danewalton/imessage-cli/internal/sender"
 	"github.com/danewalton/imessage-cli/internal/watcher"
 	"github.com/gdamore/tcell/v2"
+	"github.com/mattn/go-runewidth"
 	"github.com/rivo/tview"
 )
 
@@ -25,11 +28,31 @@ const (
 	MaxDisplayNameLength     = 30
 	MaxSenderNameLength      = 15
 	MessageRefreshDelay      = 500 * time.Millisecond
+	FrameInterval            = 33 * time.Millisecond
+	MinRefreshInterval       = time.Second
 	LockFileName             = ".imessage-tui.lock"
 	PreviewMaxWidth          = 80
 	PreviewMaxHeight         = 30
 )
 
+// Status bar help lines, one per focus mode.
+const (
+	startHelp   = "↑↓:Nav  Enter:Select  Tab:Switch  i:Input  r:Refresh  q:Quit"
+	convHelp    = "[CONV] ↑↓:Nav  Enter:Select  Tab:Switch  i:Input  r:Refresh  q:Quit"
+	msgHelp     = "[MSG] ↑↓:Scroll  h/←:Back  i:Input  p:Preview  r:Refresh  q:Quit"
+	inputHelp   = "[INPUT] Enter:Send  Esc:Cancel"
+	previewHelp = "[PREVIEW] Esc/Enter/q:Close  ↑↓:Scroll"
+)
+
+// Message view line prefixes, with their color tags already in place, so
+// formatting a message is a series of plain string writes.
+const (
+	sentTag            = "[green]["
+	receivedTag        = "[cyan]["
+	imageAttachmentTag = "              [yellow]📎 "
+	fileAttachmentTag  = "              [gray]📎 "
+)
+
 // MessagesTUI is the main TUI application.
 type MessagesTUI struct {
 	app        *tview.Application
@@ -38,24 +61,62 @@ type MessagesTUI struct {
 	msgView    *tview.TextView
 	inputField *tview.InputField
 	statusBar  *tview.TextView
+	status     string // text currently in statusBar, without padding
 	mainFlex   *tview.Flex
 
 	watcher         *watcher.MessageWatcher
 	conversations   []watcher.Conversation
+	convByID        map[int64]*watcher.Conversation
 	messages        []watcher.Message
+	messagesChatID  int64 // chat that messages belongs to
 	selectedChatID  int64
 	selectedChatIdx int
 	previewModal    *tview.TextView
+	// previewPath and previewText hold the last rendered image preview
+	previewPath string
+	previewText string
+	// msgCache holds rendered messages by ID (see messageMarkup)
+	msgCache map[int64]renderedMessage
+	// shownChatID and shownIDs describe the messages in msgView (see showMessages)
+	shownChatID int64
+	shownIDs    []int64
+	// convLabels holds conversation list labels by chat ID (see setConversationItems)
+	convLabels map[int64]convLabel
 
 	mu sync.RWMutex
 	// sendingMessage tracks whether a message send is in progress
 	sendingMessage atomic.Bool
 	// refreshing tracks whether a refresh is in progress
 	refreshing atomic.Bool
+	// lastRefresh is when the last manual refresh completed (UnixNano)
+	lastRefresh atomic.Int64
+	// drawPending is set while a coalesced redraw is scheduled (see queueUpdate)
+	drawPending atomic.Bool
+	// reloading and reloadPending coalesce live message reloads (see reloadMessages)
+	reloadMu      sync.Mutex
+	reloading     bool
+	reloadPending bool
 	// logging
-	logger  *log.Logger
-	logFile *os.File
-	debug   bool
+	logger    *log.Logger
+	logWriter *asyncWriter
+	logFile   *os.File
+	debug     bool
+}
+
+// renderedMessage is the message view markup for one message, along with
+// the time label and text it was rendered from.
+type renderedMessage struct {
+	timeStr string
+	text    string
+	markup  string
+}
+
+// convLabel is the conversation list label for one chat, along with the
+// display name and unread count it was built from.
+type convLabel struct {
+	displayName string
+	unreadCount int
+	text        string
 }
 
 // NewMessagesTUI creates a new TUI instance.
@@ -65,6 +126,51 @@ func NewMessagesTUI() *MessagesTUI {
 	}
 }
 
+// asyncWriter queues writes for a background goroutine, so debug logging
+// from input handlers and callbacks never waits on file I/O.
+type asyncWriter struct {
+	lines chan []byte
+	done  chan struct{}
+}
+
+func newAsyncWriter(w io.Writer) *asyncWriter {
+	a := &asyncWriter{
+		lines: make(chan []byte, 1024),
+		done:  make(chan struct{}),
+	}
+	go func() {
+		defer close(a.done)
+		for p := range a.lines {
+			if p == nil {
+				return
+			}
+			w.Write(p)
+		}
+	}()
+	return a
+}
+
+// Write queues a copy of p (log.Logger reuses its buffer). If the queue is
+// full the line is dropped rather than stalling the caller.
+func (a *asyncWriter) Write(p []byte) (int, error) {
+	if len(p) == 0 {
+		return 0, nil
+	}
+	select {
+	case a.lines <- append([]byte(nil), p...):
+	default:
+	}
+	return len(p), nil
+}
+
+// Close waits for the lines queued so far to be written. The channel is left
+// open (Close queues a nil marker instead), so a late log call from a
+// background goroutine is dropped rather than panicking.
+func (a *asyncWriter) Close() {
+	a.lines <- nil
+	<-a.done
+}
+
 // acquireLock attempts to acquire an exclusive lock to prevent multiple instances.
 // Returns the lock file handle (caller must close it) or an error.
 func acquireLock() (*os.File, error) {
@@ -118,11 +224,14 @@ func RunWithDebug(enable bool, logPath string) error {
 			return fmt.Errorf("unable to open log file: %w", err)
 		}
 		t.logFile = f
-		t.logger = log.New(f, "tui: ", log.LstdFlags|log.Lmicroseconds)
+		t.logWriter = newAsyncWriter(f)
+		t.logger = log.New(t.logWriter, "tui: ", log.LstdFlags|log.Lmicroseconds)
 		t.logf("debug logging enabled, file=%s", logPath)
 	}
 	defer func() {
 		if t.logFile != nil {
+			// Flush queued lines before closing the file
+			t.logWriter.Close()
 			t.logFile.Sync()
 			t.logFile.Close()
 		}
@@ -181,7 +290,7 @@ func (t *MessagesTUI) run() error {
 		SetDynamicColors(true).
 		SetTextAlign(tview.AlignCenter)
 	t.statusBar.SetBackgroundColor(tcell.ColorDarkGreen)
-	t.setStatus("↑↓:Nav  Enter:Select  Tab:Switch  i:Input  r:Refresh  q:Quit")
+	t.setStatus(startHelp)
 
 	// Layout
 	rightPanel := tview.NewFlex().SetDirection(tview.FlexRow).
@@ -244,21 +353,28 @@ func (t *MessagesTUI) setupCallbacks() {
 	// Conversation selection
 	t.convList.SetChangedFunc(func(index int, mainText, secondaryText string, shortcut rune) {
 		t.selectedChatIdx = index
-		t.mu.RLock()
+		// Write lock: loads in flight check selectedChatID to detect that
+		// they have gone stale
+		t.mu.Lock()
 		if index >= 0 && index < len(t.conversations) {
 			conv := t.conversations[index]
+			if conv.ChatID == t.selectedChatID {
+				// Selection followed the same chat to a new row
+				t.mu.Unlock()
+				return
+			}
 			t.selectedChatID = conv.ChatID
-			t.mu.RUnlock()
-			// Run in goroutine to avoid deadlock when called from within QueueUpdateDraw
+			t.mu.Unlock()
+			// Run in goroutine to keep the database query off the event loop
 			go t.loadMessages(conv.ChatID)
 		} else {
-			t.mu.RUnlock()
+			t.mu.Unlock()
 		}
 	})
 
 	t.convList.SetSelectedFunc(func(index int, mainText, secondaryText string, shortcut rune) {
 		t.app.SetFocus(t.msgView)
-		t.setStatus("[MSG] ↑↓:Scroll  h/←:Back  i:Input  p:Preview  r:Refresh  q:Quit")
+		t.setStatus(msgHelp)
 	})
 
 	// Input handling
@@ -273,7 +389,7 @@ func (t *MessagesTUI) setupCallbacks() {
 			t.app.SetFocus(t.inputField)
 		} else if key == tcell.KeyEscape {
 			t.app.SetFocus(t.msgView)
-			t.setStatus("[MSG] ↑↓:Scroll  h/←:Back  i:Input  p:Preview  r:Refresh  q:Quit")
+			t.setStatus(msgHelp)
 		}
 	})
 
@@ -298,10 +414,10 @@ func (t *MessagesTUI) setupCallbacks() {
 		case tcell.KeyTab:
 			if focused == t.convList {
 				t.app.SetFocus(t.msgView)
-				t.setStatus("[MSG] ↑↓:Scroll  h/←:Back  i:Input  p:Preview  r:Refresh  q:Quit")
+				t.setStatus(msgHelp)
 			} else {
 				t.app.SetFocus(t.convList)
-				t.setStatus("[CONV] ↑↓:Nav  Enter:Select  Tab:Switch  i:Input  r:Refresh  q:Quit")
+				t.setStatus(convHelp)
 			}
 			return nil
 
@@ -312,7 +428,7 @@ func (t *MessagesTUI) setupCallbacks() {
 				return nil
 			case 'i':
 				t.app.SetFocus(t.inputField)
-				t.setStatus("[INPUT] Enter:Send  Esc:Cancel")
+				t.setStatus(inputHelp)
 				return nil
 			case 'r', 'R':
 				t.refresh()
@@ -320,13 +436,13 @@ func (t *MessagesTUI) setupCallbacks() {
 			case 'h':
 				if focused == t.msgView {
 					t.app.SetFocus(t.convList)
-					t.setStatus("[CONV] ↑↓:Nav  Enter:Select  Tab:Switch  i:Input  r:Refresh  q:Quit")
+					t.setStatus(convHelp)
 					return nil
 				}
 			case 'l':
 				if focused == t.convList {
 					t.app.SetFocus(t.msgView)
-					t.setStatus("[MSG] ↑↓:Scroll  h/←:Back  i:Input  p:Preview  r:Refresh  q:Quit")
+					t.setStatus(msgHelp)
 					return nil
 				}
 			case 'j':
@@ -368,13 +484,13 @@ func (t *MessagesTUI) setupCallbacks() {
 		case tcell.KeyLeft:
 			if focused == t.msgView {
 				t.app.SetFocus(t.convList)
-				t.setStatus("[CONV] ↑↓:Nav  Enter:Select  Tab:Switch  i:Input  r:Refresh  q:Quit")
+				t.setStatus(convHelp)
 				return nil
 			}
 		case tcell.KeyRight:
 			if focused == t.convList {
 				t.app.SetFocus(t.msgView)
-				t.setStatus("[MSG] ↑↓:Scroll  h/←:Back  i:Input  p:Preview  r:Refresh  q:Quit")
+				t.setStatus(msgHelp)
 				return nil
 			}
 		}
@@ -383,14 +499,36 @@ func (t *MessagesTUI) setupCallbacks() {
 	})
 }
 
+// queueUpdate runs fn on the event loop and schedules a redraw. Redraws are
+// coalesced: the first update after a frame starts a FrameInterval timer, and
+// every update queued before it fires is painted by that one draw, so a burst
+// of callbacks paints once instead of once per update.
+func (t *MessagesTUI) queueUpdate(fn func()) {
+	t.app.QueueUpdate(fn)
+	if t.drawPending.CompareAndSwap(false, true) {
+		time.AfterFunc(FrameInterval, func() {
+			t.drawPending.Store(false)
+			// Draw queues behind the updates above, so they are all applied
+			t.app.Draw()
+		})
+	}
+}
+
+// setStatus shows msg in the status bar. Most calls repeat the current
+// status (e.g. the help line on every focus change), and setting the text
+// again would make the status bar re-parse it, so unchanged text is skipped.
 func (t *MessagesTUI) setStatus(msg string) {
+	if msg == t.status {
+		return
+	}
+	t.status = msg
 	t.statusBar.SetText(" " + msg + " ")
 }
 
 // setStatusAndDraw updates the status bar and forces an immediate redraw.
 // Use this when calling from the main event loop to ensure the status is visible.
 func (t *MessagesTUI) setStatusAndDraw(msg string) {
-	t.statusBar.SetText(" " + msg + " ")
+	t.setStatus(msg)
 	t.app.Draw()
 }
 
@@ -400,6 +538,20 @@ func (t *MessagesTUI) logf(format string, v ...interface{}) {
 	}
 }
 
+// setConversations stores convs along with an index by chat ID, so looking
+// up the selected chat's name or identifier doesn't scan the list.
+func (t *MessagesTUI) setConversations(convs []watcher.Conversation) {
+	byID := make(map[int64]*watcher.Conversation, len(convs))
+	for i := range convs {
+		byID[convs[i].ChatID] = &convs[i]
+	}
+
+	t.mu.Lock()
+	t.conversations = convs
+	t.convByID = byID
+	t.mu.Unlock()
+}
+
 // loadInitialData loads data synchronously before the app starts
 func (t *MessagesTUI) loadInitialData() {
 	convs := t.watcher.GetConversations(DefaultConversationLimit)
@@ -408,25 +560,10 @@ func (t *MessagesTUI) loadInitialData() {
 		t.logf("loadInitialData: got %d conversations", len(convs))
 	}
 
-	t.mu.Lock()
-	t.conversations = convs
-	t.mu.Unlock()
+	t.setConversations(convs)
 
 	// Populate UI directly (no QueueUpdateDraw needed before Run())
-	t.convList.Clear()
-	for _, conv := range convs {
-		name := conv.DisplayName
-		if len(name) > MaxDisplayNameLength {
-			name = name[:MaxDisplayNameLength-3] + "..."
-		}
-
-		secondary := t.formatTime(conv.LastMessageDate)
-		if conv.UnreadCount > 0 {
-			name = fmt.Sprintf("(%d) %s", conv.UnreadCount, name)
-		}
-
-		t.convList.AddItem(name, secondary, 0, nil)
-	}
+	t.setConversationItems(convs)
 
 	// Load first conversation's messages
 	if len(convs) > 0 {
@@ -435,101 +572,191 @@ func (t *MessagesTUI) loadInitialData() {
 
 		t.mu.Lock()
 		t.messages = msgs
+		t.messagesChatID = convs[0].ChatID
 		t.mu.Unlock()
 
 		t.msgView.SetTitle(fmt.Sprintf(" %s ", convs[0].DisplayName))
 
 		if msgs == nil {
-			t.msgView.SetText("[yellow]No messages or unable to load messages[-]")
+			t.setMessagesNotice("[yellow]No messages or unable to load messages[-]")
 		} else {
-			var builder strings.Builder
-			for _, msg := range msgs {
-				t.formatMessageLine(&builder, msg)
-			}
-			t.msgView.SetText(builder.String())
+			t.setMessages(convs[0].ChatID, msgs)
 		}
 	} else {
-		t.msgView.SetText("[yellow]No conversations found. Make sure Messages is configured and Full Disk Access is granted.[-]")
+		t.setMessagesNotice("[yellow]No conversations found. Make sure Messages is configured and Full Disk Access is granted.[-]")
 	}
 }
 
 func (t *MessagesTUI) loadConversations() {
 	convs := t.watcher.GetConversations(DefaultConversationLimit)
 
-	t.mu.Lock()
-	t.conversations = convs
-	t.mu.Unlock()
-
-	t.app.QueueUpdateDraw(func() {
-		t.convList.Clear()
-		for _, conv := range convs {
-			name := conv.DisplayName
-			if len(name) > MaxDisplayNameLength {
-				name = name[:MaxDisplayNameLength-3] + "..."
-			}
+	t.setConversations(convs)
 
-			secondary := t.formatTime(conv.LastMessageDate)
-			if conv.UnreadCount > 0 {
-				name = fmt.Sprintf("(%d) %s", conv.UnreadCount, name)
-			}
+	t.queueUpdate(func() {
+		t.setConversationItems(convs)
 
-			t.convList.AddItem(name, secondary, 0, nil)
-		}
-
-		if len(convs) > 0 && t.selectedChatID == 0 {
+		t.mu.Lock()
+		selectFirst := len(convs) > 0 && t.selectedChatID == 0
+		if selectFirst {
 			t.selectedChatID = convs[0].ChatID
-			// Run in goroutine to avoid deadlock from nested QueueUpdateDraw
+		}
+		t.mu.Unlock()
+		if selectFirst {
+			// Run in goroutine to keep the database query off the event loop
 			go t.loadMessages(convs[0].ChatID)
 		}
 	})
 }
 
+// loadMessages loads and shows the selected chat's messages. Moving through
+// the conversation list starts a load per row, and those can finish out of
+// order, so a load whose chat is no longer selected discards its result
+// instead of overwriting the newer selection's messages.
 func (t *MessagesTUI) loadMessages(chatID int64) {
-	// Show loading indicator
-	t.app.QueueUpdateDraw(func() {
-		t.msgView.SetText("[yellow]Loading messages...[-]")
+	if !t.isSelected(chatID) {
+		return
+	}
+
+	// Show loading indicator when switching chats; a reload of the chat on
+	// screen keeps showing it until the new messages are appended
+	t.queueUpdate(func() {
+		if chatID != t.shownChatID {
+			t.setMessagesNotice("[yellow]Loading messages...[-]")
+		}
 	})
 
 	msgs := t.watcher.GetMessages(chatID, DefaultMessageLimit)
 
 	t.mu.Lock()
+	if t.selectedChatID != chatID {
+		t.mu.Unlock()
+		return
+	}
 	t.messages = msgs
-	t.selectedChatID = chatID
+	t.messagesChatID = chatID
 	t.mu.Unlock()
 
 	// Find conversation name
 	var chatName string
 	t.mu.RLock()
-	for _, conv := range t.conversations {
-		if conv.ChatID == chatID {
-			chatName = conv.DisplayName
-			break
-		}
+	if conv, ok := t.convByID[chatID]; ok {
+		chatName = conv.DisplayName
 	}
 	t.mu.RUnlock()
 
-	t.app.QueueUpdateDraw(func() {
-		t.msgView.Clear()
+	t.queueUpdate(func() {
+		// A newer selection's update may have been queued first
+		if !t.isSelected(chatID) {
+			return
+		}
 		t.msgView.SetTitle(fmt.Sprintf(" %s ", chatName))
 
 		if msgs == nil {
-			t.msgView.SetText("[red]Unable to load messages[-]")
+			t.setMessagesNotice("[red]Unable to load messages[-]")
 			return
 		}
 
-		var builder strings.Builder
-		for _, msg := range msgs {
-			t.formatMessageLine(&builder, msg)
+		t.showMessages(chatID, msgs)
+	})
+}
+
+// isSelected reports whether chatID is the selected chat.
+func (t *MessagesTUI) isSelected(chatID int64) bool {
+	t.mu.RLock()
+	defer t.mu.RUnlock()
+	return t.selectedChatID == chatID
+}
+
+// loadNewMessages brings the chat's messages up to date by fetching only
+// messages newer than the newest one already loaded, and appending them. It
+// falls back to a full load when the loaded messages belong to another chat.
+// Edits and deletions of loaded messages show up on the next full load (chat
+// switch or manual refresh).
+func (t *MessagesTUI) loadNewMessages(chatID int64) {
+	// As in loadMessages, a reload or post-send fetch started for a chat
+	// that is no longer selected must not replace the selection's messages
+	if !t.isSelected(chatID) {
+		return
+	}
+
+	t.mu.RLock()
+	loaded, loadedChatID := t.messages, t.messagesChatID
+	t.mu.RUnlock()
+
+	if loadedChatID != chatID || len(loaded) == 0 {
+		t.loadMessages(chatID)
+		return
+	}
+
+	var lastID int64
+	for _, msg := range loaded {
+		lastID = max(lastID, msg.MessageID)
+	}
+	added := t.watcher.GetMessagesSince(chatID, lastID, DefaultMessageLimit)
+	if len(added) == 0 {
+		return
+	}
+
+	msgs := make([]watcher.Message, 0, len(loaded)+len(added))
+	msgs = append(append(msgs, loaded...), added...)
+	if len(msgs) > DefaultMessageLimit {
+		msgs = msgs[len(msgs)-DefaultMessageLimit:]
+	}
+
+	t.mu.Lock()
+	if t.messagesChatID != chatID || t.selectedChatID != chatID {
+		// Another chat was selected or loaded meanwhile
+		t.mu.Unlock()
+		return
+	}
+	t.messages = msgs
+	t.mu.Unlock()
+
+	t.queueUpdate(func() {
+		// A newer selection's update may have been queued first
+		if !t.isSelected(chatID) {
+			return
 		}
-		t.msgView.SetText(builder.String())
-		t.msgView.ScrollToEnd()
+		t.showMessages(chatID, msgs)
 	})
 }
 
+// reloadMessages updates the selected chat's messages for a live update.
+// Watcher callbacks each run on their own goroutine, so a burst of polls
+// would otherwise run overlapping reloads of the same chat; instead, requests
+// that arrive while a reload is running collapse into one more reload after
+// it finishes.
+func (t *MessagesTUI) reloadMessages() {
+	t.reloadMu.Lock()
+	if t.reloading {
+		t.reloadPending = true
+		t.reloadMu.Unlock()
+		return
+	}
+	t.reloading = true
+	t.reloadMu.Unlock()
+
+	for {
+		t.mu.RLock()
+		chatID := t.selectedChatID
+		t.mu.RUnlock()
+		t.loadNewMessages(chatID)
+
+		t.reloadMu.Lock()
+		if !t.reloadPending {
+			t.reloading = false
+			t.reloadMu.Unlock()
+			return
+		}
+		t.reloadPending = false
+		t.reloadMu.Unlock()
+	}
+}
+
 func (t *MessagesTUI) sendMessage(text string) {
 	// Prevent multiple concurrent sends
 	if !t.sendingMessage.CompareAndSwap(false, true) {
-		t.app.QueueUpdateDraw(func() {
+		t.queueUpdate(func() {
 			t.setStatus("⏳ Already sending a message...")
 		})
 		return
@@ -538,17 +765,14 @@ func (t *MessagesTUI) sendMessage(text string) {
 	t.mu.RLock()
 	chatID := t.selectedChatID
 	var chatIdent string
-	for _, conv := range t.conversations {
-		if conv.ChatID == chatID {
-			chatIdent = conv.ChatIdentifier
-			break
-		}
+	if conv, ok := t.convByID[chatID]; ok {
+		chatIdent = conv.ChatIdentifier
 	}
 	t.mu.RUnlock()
 
 	if chatIdent == "" {
 		t.sendingMessage.Store(false)
-		t.app.QueueUpdateDraw(func() {
+		t.queueUpdate(func() {
 			t.setStatus("Error: No conversation selected")
 		})
 		return
@@ -558,24 +782,27 @@ func (t *MessagesTUI) sendMessage(text string) {
 	go func() {
 		defer t.sendingMessage.Store(false)
 
-		t.app.QueueUpdateDraw(func() {
+		t.queueUpdate(func() {
 			t.setStatus("📤 Sending...")
 		})
 
 		err := sender.SendMessage(chatIdent, text)
 		if err != nil {
-			t.app.QueueUpdateDraw(func() {
+			t.queueUpdate(func() {
 				t.setStatus(fmt.Sprintf("❌ Error: %v", err))
 				// Restore the message text so user can retry
 				t.inputField.SetText(text)
 			})
 		} else {
-			t.app.QueueUpdateDraw(func() {
+			t.queueUpdate(func() {
 				t.setStatus("✓ Message sent!")
 			})
-			// Refresh messages after a short delay
+			// Messages has usually written the message by now; poll
+			// right away rather than waiting for the next tick
+			t.watcher.Wake()
+			// Fetch the sent message after a short delay in case it hasn't
 			time.Sleep(MessageRefreshDelay)
-			t.loadMessages(chatID)
+			t.loadNewMessages(chatID)
 		}
 	}()
 }
@@ -583,6 +810,13 @@ func (t *MessagesTUI) sendMessage(text string) {
 func (t *MessagesTUI) refresh() {
 	t.logf("refresh: called")
 
+	// A refresh just completed; repeated presses shouldn't re-run both queries
+	if last := t.lastRefresh.Load(); last != 0 && time.Since(time.Unix(0, last)) < MinRefreshInterval {
+		t.logf("refresh: refreshed recently, skipping")
+		t.setStatus("✓ Refreshed!")
+		return
+	}
+
 	// Prevent concurrent refreshes
 	if !t.refreshing.CompareAndSwap(false, true) {
 		t.logf("refresh: already refreshing, skipping")
@@ -628,16 +862,16 @@ func (t *MessagesTUI) refresh() {
 			t.logf("refresh: received conversations from channel")
 		case <-time.After(5 * time.Second):
 			t.logf("refresh: TIMEOUT waiting for conversations")
-			t.app.QueueUpdateDraw(func() {
+			t.queueUpdate(func() {
 				t.setStatus("⚠️ Refresh timeout - database may be busy")
 			})
 			return
 		}
 
-		t.mu.Lock()
-		t.conversations = convs
+		t.setConversations(convs)
+		t.mu.RLock()
 		chatID := t.selectedChatID
-		t.mu.Unlock()
+		t.mu.RUnlock()
 
 		t.logf("refresh: got %d convs, chatID=%d, fetching messages...", len(convs), chatID)
 
@@ -660,7 +894,7 @@ func (t *MessagesTUI) refresh() {
 				t.logf("refresh: received messages from channel")
 			case <-time.After(5 * time.Second):
 				t.logf("refresh: TIMEOUT waiting for messages")
-				t.app.QueueUpdateDraw(func() {
+				t.queueUpdate(func() {
 					t.setStatus("⚠️ Message load timeout - database may be busy")
 				})
 				return
@@ -668,57 +902,37 @@ func (t *MessagesTUI) refresh() {
 
 			t.mu.Lock()
 			t.messages = msgs
+			t.messagesChatID = chatID
 			t.mu.Unlock()
 
 			// Find conversation name
 			t.mu.RLock()
-			for _, conv := range t.conversations {
-				if conv.ChatID == chatID {
-					chatName = conv.DisplayName
-					break
-				}
+			if conv, ok := t.convByID[chatID]; ok {
+				chatName = conv.DisplayName
 			}
 			t.mu.RUnlock()
 		}
 
-		t.logf("refresh: calling QueueUpdateDraw to update UI...")
+		t.logf("refresh: calling queueUpdate to update UI...")
 
-		// Single QueueUpdateDraw call to update all UI elements atomically
-		t.app.QueueUpdateDraw(func() {
-			t.logf("refresh: inside QueueUpdateDraw callback")
+		// Single queueUpdate call to update all UI elements atomically
+		t.queueUpdate(func() {
+			t.logf("refresh: inside queueUpdate callback")
 			// Update conversation list
-			t.convList.Clear()
-			for _, conv := range convs {
-				name := conv.DisplayName
-				if len(name) > MaxDisplayNameLength {
-					name = name[:MaxDisplayNameLength-3] + "..."
-				}
-
-				secondary := t.formatTime(conv.LastMessageDate)
-				if conv.UnreadCount > 0 {
-					name = fmt.Sprintf("(%d) %s", conv.UnreadCount, name)
-				}
-
-				t.convList.AddItem(name, secondary, 0, nil)
-			}
+			t.setConversationItems(convs)
 
 			// Update messages if we have a selected chat
 			if chatID > 0 && msgs != nil {
-				t.msgView.Clear()
 				t.msgView.SetTitle(fmt.Sprintf(" %s ", chatName))
-
-				var builder strings.Builder
-				for _, msg := range msgs {
-					t.formatMessageLine(&builder, msg)
-				}
-				t.msgView.SetText(builder.String())
+				t.setMessages(chatID, msgs)
 				t.msgView.ScrollToEnd()
 			}
 
 			t.setStatus("✓ Refreshed!")
-			t.logf("refresh: QueueUpdateDraw callback complete")
+			t.logf("refresh: queueUpdate callback complete")
 		})
-		t.logf("refresh: QueueUpdateDraw returned")
+		t.lastRefresh.Store(time.Now().UnixNano())
+		t.logf("refresh: queueUpdate returned")
 	}()
 }
 
@@ -733,14 +947,14 @@ func (t *MessagesTUI) onNewMessages(msgs []watcher.Message) {
 	// Check if any messages are for the current chat
 	for _, msg := range msgs {
 		if msg.ChatID == currentChatID {
-			t.loadMessages(currentChatID)
+			t.reloadMessages()
 			break
 		}
 	}
 
 	// Show notification for incoming messages
 	if len(msgs) > 0 && !msgs[len(msgs)-1].IsFromMe {
-		t.app.QueueUpdateDraw(func() {
+		t.queueUpdate(func() {
 			t.setStatus(fmt.Sprintf("📬 New message from %s", msgs[len(msgs)-1].Sender))
 		})
 	}
@@ -750,72 +964,243 @@ func (t *MessagesTUI) onConversationsUpdated(convs []watcher.Conversation) {
 	if t.logger != nil {
 		t.logf("onConversationsUpdated: got %d convs", len(convs))
 	}
-	t.mu.Lock()
-	t.conversations = convs
-	t.mu.Unlock()
+	t.setConversations(convs)
 
-	t.app.QueueUpdateDraw(func() {
-		// Preserve selection
-		selectedIdx := t.convList.GetCurrentItem()
-
-		t.convList.Clear()
-		for _, conv := range convs {
-			name := conv.DisplayName
-			if len(name) > MaxDisplayNameLength {
-				name = name[:MaxDisplayNameLength-3] + "..."
-			}
+	t.queueUpdate(func() {
+		// Rows are updated in place, so the selection stays where it was
+		t.setConversationItems(convs)
+	})
+}
 
-			secondary := t.formatTime(conv.LastMessageDate)
+// setConversationItems shows convs in the conversation list. Rows are
+// compared with what the list already holds and only changed rows are
+// rewritten, with the list growing or shrinking at the tail, so a poll that
+// bumps one unread count touches one row. Clearing and re-adding every item
+// also reset the selection and fired the changed handler (reloading messages)
+// on each update.
+func (t *MessagesTUI) setConversationItems(convs []watcher.Conversation) {
+	now := time.Now()
+	labels := make(map[int64]convLabel, len(convs))
+	count := t.convList.GetItemCount()
+	for i, conv := range convs {
+		label, ok := t.convLabels[conv.ChatID]
+		if !ok || label.displayName != conv.DisplayName || label.unreadCount != conv.UnreadCount {
+			name := truncateToWidth(conv.DisplayName, MaxDisplayNameLength)
 			if conv.UnreadCount > 0 {
 				name = fmt.Sprintf("(%d) %s", conv.UnreadCount, name)
 			}
+			label = convLabel{displayName: conv.DisplayName, unreadCount: conv.UnreadCount, text: name}
+		}
+		labels[conv.ChatID] = label
+		name := label.text
+		secondary := formatTime(conv.LastMessageDate, now)
 
-			t.convList.AddItem(name, secondary, 0, nil)
+		if i < count {
+			if main, sec := t.convList.GetItemText(i); main != name || sec != secondary {
+				t.convList.SetItemText(i, name, secondary)
+			}
+			continue
 		}
+		t.convList.AddItem(name, secondary, 0, nil)
+	}
+	for i := count - 1; i >= len(convs); i-- {
+		t.convList.RemoveItem(i)
+	}
+	t.convLabels = labels
 
-		if selectedIdx >= 0 && selectedIdx < len(convs) {
-			t.convList.SetCurrentItem(selectedIdx)
+	// Keep the selected chat highlighted when a new message reorders the list
+	t.mu.RLock()
+	selected := t.selectedChatID
+	t.mu.RUnlock()
+	for i, conv := range convs {
+		if conv.ChatID == selected {
+			if i != t.convList.GetCurrentItem() {
+				t.convList.SetCurrentItem(i)
+			}
+			break
 		}
-	})
+	}
+}
+
+// truncateToWidth shortens s to at most width terminal cells, ending it with
+// "..." when it is cut. ASCII strings (the common case) are measured and cut
+// by byte; anything else goes through runewidth so multi-byte characters are
+// never split and wide characters count as two cells.
+func truncateToWidth(s string, width int) string {
+	for i := 0; i < len(s); i++ {
+		if s[i] >= utf8.RuneSelf {
+			if runewidth.StringWidth(s) <= width {
+				return s
+			}
+			return runewidth.Truncate(s, width, "...")
+		}
+	}
+	if len(s) <= width {
+		return s
+	}
+	return s[:width-3] + "..."
 }
 
-func (t *MessagesTUI) formatTime(tm *time.Time) string {
+// formatTime returns a short label for tm relative to now. Callers read the
+// clock once per render and pass it in. The fixed-width labels are built from
+// their digits directly rather than through time.Format, which parses its
+// layout string on every call.
+func formatTime(tm *time.Time, now time.Time) string {
 	if tm == nil {
 		return ""
 	}
 
+	switch diff := now.Sub(*tm); {
+	case diff < 24*time.Hour:
+		h, m, _ := tm.Clock()
+		return string([]byte{byte('0' + h/10), byte('0' + h%10), ':', byte('0' + m/10), byte('0' + m%10)})
+	case diff < 48*time.Hour:
+		return "Yesterday"
+	case diff < 168*time.Hour:
+		return shortWeekdays[tm.Weekday()]
+	}
+	_, month, day := tm.Date()
+	return string([]byte{byte('0' + month/10), byte('0' + month%10), '/', byte('0' + day/10), byte('0' + day%10)})
+}
+
+// shortWeekdays are the weekday labels formatTime uses, indexed by time.Weekday.
+var shortWeekdays = [...]string{"Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"}
+
+// setMessages replaces the message view's text with msgs for chatID.
+func (t *MessagesTUI) setMessages(chatID int64, msgs []watcher.Message) {
+	t.msgView.SetText(t.renderMessages(msgs))
+	t.shownChatID = chatID
+	t.shownIDs = t.shownIDs[:0]
+	for _, msg := range msgs {
+		t.shownIDs = append(t.shownIDs, msg.MessageID)
+	}
+}
+
+// setMessagesNotice shows a notice in place of messages.
+func (t *MessagesTUI) setMessagesNotice(text string) {
+	t.msgView.SetText(text)
+	t.shownChatID = 0
+	t.shownIDs = t.shownIDs[:0]
+}
+
+// showMessages brings the message view up to date with msgs for chatID. When
+// msgs is what is already shown plus newer messages, only the new messages
+// are rendered and appended, so the view's existing text is not set and
+// parsed again; with nothing new the view (and its scroll position) is left
+// alone. Anything else, or letting appends grow the view to twice the
+// message limit, replaces the text.
+func (t *MessagesTUI) showMessages(chatID int64, msgs []watcher.Message) {
+	added, ok := t.messagesAfterShown(chatID, msgs)
+	if !ok || len(t.shownIDs)+len(added) > 2*DefaultMessageLimit {
+		t.setMessages(chatID, msgs)
+		t.msgView.ScrollToEnd()
+		return
+	}
+	if len(added) == 0 {
+		return
+	}
+
 	now := time.Now()
-	diff := now.Sub(*tm)
+	var builder strings.Builder
+	for _, msg := range added {
+		builder.WriteString(t.messageMarkup(msg, now))
+		t.shownIDs = append(t.shownIDs, msg.MessageID)
+	}
+	t.msgView.Write([]byte(builder.String()))
+	t.msgView.ScrollToEnd()
+}
 
-	if diff.Hours() < 24 {
-		return tm.Format("15:04")
-	} else if diff.Hours() < 48 {
-		return "Yesterday"
-	} else if diff.Hours() < 168 {
-		return tm.Format("Mon")
+// messagesAfterShown returns the messages in msgs that follow the last one in
+// the message view. ok is false unless msgs, up to that message, matches the
+// end of what is shown: a different chat, or a message that sorted in before
+// the last shown one, needs the text replaced instead.
+func (t *MessagesTUI) messagesAfterShown(chatID int64, msgs []watcher.Message) (added []watcher.Message, ok bool) {
+	if chatID != t.shownChatID || len(t.shownIDs) == 0 {
+		return nil, false
 	}
-	return tm.Format("01/02")
+	last := t.shownIDs[len(t.shownIDs)-1]
+	for k := len(msgs) - 1; k >= 0; k-- {
+		if msgs[k].MessageID != last {
+			continue
+		}
+		if k+1 > len(t.shownIDs) {
+			return nil, false
+		}
+		shown := t.shownIDs[len(t.shownIDs)-(k+1):]
+		for i := 0; i <= k; i++ {
+			if msgs[i].MessageID != shown[i] {
+				return nil, false
+			}
+		}
+		return msgs[k+1:], true
+	}
+	return nil, false
+}
+
+// renderMessages renders msgs for the message view. Entries in the message
+// cache for messages not in msgs are dropped.
+func (t *MessagesTUI) renderMessages(msgs []watcher.Message) string {
+	now := time.Now()
+	var builder strings.Builder
+	for _, msg := range msgs {
+		builder.WriteString(t.messageMarkup(msg, now))
+	}
+
+	if len(t.msgCache) > len(msgs) {
+		kept := make(map[int64]renderedMessage, len(msgs))
+		for _, msg := range msgs {
+			kept[msg.MessageID] = t.msgCache[msg.MessageID]
+		}
+		t.msgCache = kept
+	}
+	return builder.String()
+}
+
+// messageMarkup returns the message view markup for msg. Markup is memoized
+// by message ID and reused while the message's time label and text are
+// unchanged, so a refresh or new message only formats what is new. Called on
+// the UI goroutine only.
+func (t *MessagesTUI) messageMarkup(msg watcher.Message, now time.Time) string {
+	timeStr := formatTime(msg.Date, now)
+	r, ok := t.msgCache[msg.MessageID]
+	if !ok || r.timeStr != timeStr || r.text != msg.Text {
+		var line strings.Builder
+		t.formatMessageLine(&line, msg, timeStr)
+		r = renderedMessage{timeStr: timeStr, text: msg.Text, markup: line.String()}
+		if t.msgCache == nil {
+			t.msgCache = make(map[int64]renderedMessage)
+		}
+		t.msgCache[msg.MessageID] = r
+	}
+	return r.markup
 }
 
 // formatMessageLine renders a single message (with attachment info) into the builder.
-func (t *MessagesTUI) formatMessageLine(builder *strings.Builder, msg watcher.Message) {
-	timeStr := t.formatTime(msg.Date)
+func (t *MessagesTUI) formatMessageLine(builder *strings.Builder, msg watcher.Message, timeStr string) {
 	if msg.IsFromMe {
-		builder.WriteString(fmt.Sprintf("[green][%s] Me:[-] %s\n", timeStr, msg.Text))
+		builder.WriteString(sentTag)
+		builder.WriteString(timeStr)
+		builder.WriteString("] Me:[-] ")
 	} else {
-		sender := msg.Sender
-		if len(sender) > MaxSenderNameLength {
-			sender = sender[:MaxSenderNameLength-3] + "..."
-		}
-		builder.WriteString(fmt.Sprintf("[cyan][%s] %s:[-] %s\n", timeStr, sender, msg.Text))
+		builder.WriteString(receivedTag)
+		builder.WriteString(timeStr)
+		builder.WriteString("] ")
+		builder.WriteString(truncateToWidth(msg.Sender, MaxSenderNameLength))
+		builder.WriteString(":[-] ")
 	}
+	builder.WriteString(msg.Text)
+	builder.WriteByte('\n')
 
 	// Show attachment indicators
 	for _, att := range msg.Attachments {
 		if att.IsImage {
-			builder.WriteString(fmt.Sprintf("              [yellow]📎 %s (image · p to preview)[-]\n", att.Filename))
+			builder.WriteString(imageAttachmentTag)
+			builder.WriteString(att.Filename)
+			builder.WriteString(" (image · p to preview)[-]\n")
 		} else {
-			builder.WriteString(fmt.Sprintf("              [gray]📎 %s[-]\n", att.Filename))
+			builder.WriteString(fileAttachmentTag)
+			builder.WriteString(att.Filename)
+			builder.WriteString("[-]\n")
 		}
 	}
 }
@@ -823,42 +1208,34 @@ func (t *MessagesTUI) formatMessageLine(builder *strings.Builder, msg watcher.Me
 // showImagePreview shows a modal with a half-block rendered image.
 func (t *MessagesTUI) showImagePreview(att watcher.Attachment) {
 	go func() {
-		t.app.QueueUpdateDraw(func() {
-			t.setStatus("🖼️  Rendering preview...")
-		})
+		// Reopening the last preview reuses its rendering instead of
+		// decoding and scaling the image again.
+		t.mu.RLock()
+		rendered, cached := t.previewText, t.previewPath == att.FilePath
+		t.mu.RUnlock()
+
+		var err error
+		if !cached {
+			t.queueUpdate(func() {
+				t.setStatus("🖼️  Rendering preview...")
+			})
 
-		rendered, err := RenderImageToText(att.FilePath, PreviewMaxWidth, PreviewMaxHeight)
+			rendered, err = RenderImageToText(att.FilePath, PreviewMaxWidth, PreviewMaxHeight)
+			if err == nil {
+				t.mu.Lock()
+				t.previewPath, t.previewText = att.FilePath, rendered
+				t.mu.Unlock()
+			}
+		}
 
-		t.app.QueueUpdateDraw(func() {
+		t.queueUpdate(func() {
 			if err != nil {
 				t.setStatus(fmt.Sprintf("❌ Preview failed: %v", err))
 				return
 			}
 
 			if t.previewModal == nil {
-				t.previewModal = tview.NewTextView().
-					SetDynamicColors(true).
-					SetScrollable(true).
-					SetWrap(false)
-				t.previewModal.SetBorder(true).
-					SetBorderColor(tcell.ColorYellow)
-				t.previewModal.SetInputCapture(func(event *tcell.EventKey) *tcell.EventKey {
-					switch event.Key() {
-					case tcell.KeyEscape, tcell.KeyEnter:
-						t.pages.RemovePage("preview")
-						t.app.SetFocus(t.msgView)
-						t.setStatus("[MSG] ↑↓:Scroll  h/←:Back  i:Input  p:Preview  r:Refresh  q:Quit")
-						return nil
-					case tcell.KeyRune:
-						if event.Rune() == 'q' {
-							t.pages.RemovePage("preview")
-							t.app.SetFocus(t.msgView)
-							t.setStatus("[MSG] ↑↓:Scroll  h/←:Back  i:Input  p:Preview  r:Refresh  q:Quit")
-							return nil
-						}
-					}
-					return event
-				})
+				t.createPreviewModal()
 			}
 
 			title := fmt.Sprintf(" 🖼️  %s (Esc to close) ", att.Filename)
@@ -866,22 +1243,56 @@ func (t *MessagesTUI) showImagePreview(att watcher.Attachment) {
 			t.previewModal.SetText(rendered)
 			t.previewModal.ScrollToBeginning()
 
-			// Center the modal as an overlay
-			modal := tview.NewFlex().
-				AddItem(nil, 0, 1, false).
-				AddItem(tview.NewFlex().SetDirection(tview.FlexRow).
-					AddItem(nil, 0, 1, false).
-					AddItem(t.previewModal, PreviewMaxHeight+2, 0, true).
-					AddItem(nil, 0, 1, false), PreviewMaxWidth+2, 0, true).
-				AddItem(nil, 0, 1, false)
-
-			t.pages.AddPage("preview", modal, true, true)
+			t.pages.ShowPage("preview")
 			t.app.SetFocus(t.previewModal)
-			t.setStatus("[PREVIEW] Esc/Enter/q:Close  ↑↓:Scroll")
+			t.setStatus(previewHelp)
 		})
 	}()
 }
 
+// createPreviewModal builds the preview text view and its centered overlay
+// once, adding it as a hidden page; previews show and hide that page rather
+// than building a new layout each time.
+func (t *MessagesTUI) createPreviewModal() {
+	t.previewModal = tview.NewTextView().
+		SetDynamicColors(true).
+		SetScrollable(true).
+		SetWrap(false)
+	t.previewModal.SetBorder(true).
+		SetBorderColor(tcell.ColorYellow)
+	t.previewModal.SetInputCapture(func(event *tcell.EventKey) *tcell.EventKey {
+		switch event.Key() {
+		case tcell.KeyEscape, tcell.KeyEnter:
+			t.closePreview()
+			return nil
+		case tcell.KeyRune:
+			if event.Rune() == 'q' {
+				t.closePreview()
+				return nil
+			}
+		}
+		return event
+	})
+
+	// Center the modal as an overlay
+	modal := tview.NewFlex().
+		AddItem(nil, 0, 1, false).
+		AddItem(tview.NewFlex().SetDirection(tview.FlexRow).
+			AddItem(nil, 0, 1, false).
+			AddItem(t.previewModal, PreviewMaxHeight+2, 0, true).
+			AddItem(nil, 0, 1, false), PreviewMaxWidth+2, 0, true).
+		AddItem(nil, 0, 1, false)
+
+	t.pages.AddPage("preview", modal, true, false)
+}
+
+// closePreview hides the preview modal and returns focus to the messages.
+func (t *MessagesTUI) closePreview() {
+	t.pages.HidePage("preview")
+	t.app.SetFocus(t.msgView)
+	t.setStatus(msgHelp)
+}
+
 // findNearestImageAttachment scans messages for the nearest image attachment,
 // searching backwards from the most recent message.
 func (t *MessagesTUI) findNearestImageAttachment() *watcher.Attachment {
@@ -0,0 +1,52 @@
+package tui
+
+import (
+	"testing"
+	"time"
+)
+
+func TestTruncateToWidth(t *testing.T) {
+	tests := []struct {
+		in    string
+		width int
+		want  string
+	}{
+		{"", 10, ""},
+		{"short", 10, "short"},
+		{"exactly10!", 10, "exactly10!"},
+		{"this is too long", 10, "this is..."},
+		{"日本語の名前です", 16, "日本語の名前です"},
+		{"日本語の名前です", 10, "日本語..."},
+	}
+	for _, tt := range tests {
+		if got := truncateToWidth(tt.in, tt.width); got != tt.want {
+			t.Errorf("truncateToWidth(%q, %d) = %q, want %q", tt.in, tt.width, got, tt.want)
+		}
+	}
+}
+
+func TestFormatTime(t *testing.T) {
+	if got := formatTime(nil, time.Now()); got != "" {
+		t.Errorf("formatTime(nil) = %q, want empty", got)
+	}
+
+	// Wednesday
+	now := time.Date(2024, time.March, 13, 15, 0, 0, 0, time.Local)
+	tests := []struct {
+		name string
+		tm   time.Time
+		want string
+	}{
+		{"today", time.Date(2024, time.March, 13, 9, 5, 0, 0, time.Local), "09:05"},
+		{"under a day ago", time.Date(2024, time.March, 12, 23, 59, 0, 0, time.Local), "23:59"},
+		{"yesterday", time.Date(2024, time.March, 12, 8, 0, 0, 0, time.Local), "Yesterday"},
+		{"this week", time.Date(2024, time.March, 9, 12, 0, 0, 0, time.Local), "Sat"},
+		{"older", time.Date(2024, time.January, 2, 12, 0, 0, 0, time.Local), "01/02"},
+		{"december", time.Date(2023, time.December, 31, 12, 0, 0, 0, time.Local), "12/31"},
+	}
+	for _, tt := range tests {
+		if got := formatTime(&tt.tm, now); got != tt.want {
+			t.Errorf("%s: formatTime(%v) = %q, want %q", tt.name, tt.tm, got, tt.want)
+		}
+	}
+}
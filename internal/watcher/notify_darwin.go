@@ -0,0 +1,94 @@
+package watcher
+
+import (
+	"syscall"
+	"time"
+)
+
+// notifyRetryInterval is how long watchDBFiles waits between checks for
+// stop and for files that could not be opened yet. Stop doesn't wait for the
+// notifier, which exits on its own within this interval.
+const notifyRetryInterval = time.Second
+
+// watchDBFiles wakes the poll loop whenever chat.db or chat.db-wal is
+// written, using kqueue vnode events, so new messages are picked up as soon
+// as Messages writes them rather than at the next (possibly backed-off)
+// tick. Polling keeps running as the fallback. The -shm file is skipped:
+// SQLite updates it through mmap, which raises no events, and every reader
+// touches it. The notifier runs until stopCh is closed; if kqueue is
+// unavailable, nothing is started.
+func (w *MessageWatcher) watchDBFiles(stopCh <-chan struct{}) {
+	kq, err := syscall.Kqueue()
+	if err != nil {
+		return
+	}
+
+	go func() {
+		defer syscall.Close(kq)
+
+		// SQLite deletes and recreates the WAL, so a file whose
+		// descriptor reports deletion is closed and reopened by path.
+		paths := w.dbFiles[:]
+		fds := make([]int, len(paths))
+		for i := range fds {
+			fds[i] = -1
+		}
+		defer func() {
+			for _, fd := range fds {
+				if fd >= 0 {
+					syscall.Close(fd)
+				}
+			}
+		}()
+
+		timeout := syscall.NsecToTimespec(int64(notifyRetryInterval))
+		events := make([]syscall.Kevent_t, len(paths))
+		for {
+			select {
+			case <-stopCh:
+				return
+			default:
+			}
+
+			for i, path := range paths {
+				if fds[i] >= 0 {
+					continue
+				}
+				fd, err := syscall.Open(path, syscall.O_EVTONLY, 0)
+				if err != nil {
+					continue
+				}
+				var ev syscall.Kevent_t
+				syscall.SetKevent(&ev, fd, syscall.EVFILT_VNODE, syscall.EV_ADD|syscall.EV_CLEAR)
+				ev.Fflags = syscall.NOTE_WRITE | syscall.NOTE_EXTEND | syscall.NOTE_DELETE | syscall.NOTE_RENAME
+				if _, err := syscall.Kevent(kq, []syscall.Kevent_t{ev}, nil, nil); err != nil {
+					syscall.Close(fd)
+					continue
+				}
+				fds[i] = fd
+			}
+
+			n, err := syscall.Kevent(kq, nil, events, &timeout)
+			if err != nil {
+				if err == syscall.EINTR {
+					continue
+				}
+				return
+			}
+			for _, ev := range events[:n] {
+				if ev.Fflags&(syscall.NOTE_DELETE|syscall.NOTE_RENAME) != 0 {
+					for i, fd := range fds {
+						if uint64(fd) == ev.Ident {
+							// Closing the descriptor removes its event
+							syscall.Close(fd)
+							fds[i] = -1
+						}
+					}
+				}
+			}
+			if n > 0 {
+				w.Wake()
+			}
+		}
+	}()
+}
@@ -0,0 +1,7 @@
+//go:build !darwin
+
+package watcher
+
+// watchDBFiles is only implemented on macOS; elsewhere the watcher relies
+// on polling alone.
+func (w *MessageWatcher) watchDBFiles(stopCh <-chan struct{}) {}
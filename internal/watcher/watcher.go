@@ -16,6 +16,11 @@ import (
 const (
 	DefaultPollInterval      = 500 * time.Millisecond
 	DefaultConversationLimit = 50
+
+	// MaxPollInterval caps the idle backoff, bounding how late a message
+	// from another device can show up once the database has gone quiet.
+	MaxPollInterval     = 4 * time.Second
+	IdlePollsPerBackoff = 5
 )
 
 // Attachment mirrors database.Attachment for the watcher layer.
@@ -67,6 +72,7 @@ type ErrorCallback func(error)
 // MessageWatcher watches the iMessage database for new messages.
 type MessageWatcher struct {
 	pollInterval          time.Duration
+	dbFiles               [2]string // chat.db and its -wal file
 	running               bool
 	lastMessageID         atomic.Int64
 	lastMtime             atomic.Int64
@@ -75,16 +81,28 @@ type MessageWatcher struct {
 	errorCallbacks        []ErrorCallback
 	mu                    sync.RWMutex
 	stopCh                chan struct{}
+	wakeCh                chan struct{}
 	wg                    sync.WaitGroup
+
+	// convCache holds the last GetConversations result along with the
+	// limit and database mtime it was fetched for.
+	convMu         sync.Mutex
+	convCache      []Conversation
+	convCacheLimit int
+	convCacheMtime int64
+
 	// logger for debugging callback issues
 	logger *log.Logger
 }
 
 // NewMessageWatcher creates a new MessageWatcher.
 func NewMessageWatcher(pollInterval time.Duration) *MessageWatcher {
+	dbPath := database.GetDBPath()
 	return &MessageWatcher{
 		pollInterval: pollInterval,
+		dbFiles:      [2]string{dbPath, dbPath + "-wal"},
 		stopCh:       make(chan struct{}),
+		wakeCh:       make(chan struct{}, 1),
 	}
 }
 
@@ -109,14 +127,38 @@ func (w *MessageWatcher) OnError(callback ErrorCallback) {
 	w.errorCallbacks = append(w.errorCallbacks, callback)
 }
 
+// lastMessageIDQuery and newMessagesQuery run on every poll that sees a
+// change, so they are prepared once through database.Prepare.
+const lastMessageIDQuery = "SELECT MAX(ROWID) FROM message"
+
+const newMessagesQuery = `
+	SELECT 
+		m.ROWID as message_id,
+		m.text,
+		` + database.AttributedBodyColumn + ` as attributedBody,
+		m.date,
+		m.is_from_me,
+		m.is_read,
+		h.id as sender_id,
+		c.ROWID as chat_id,
+		c.chat_identifier,
+		c.display_name
+	FROM message m
+	LEFT JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
+	LEFT JOIN chat c ON cmj.chat_id = c.ROWID
+	LEFT JOIN handle h ON m.handle_id = h.ROWID
+	WHERE m.ROWID > ?
+	ORDER BY m.date ASC
+`
+
 func (w *MessageWatcher) getLastMessageID() int64 {
-	db, err := database.DB()
+	stmt, err := database.Prepare(lastMessageIDQuery)
 	if err != nil {
 		return 0
 	}
 
 	var maxID sql.NullInt64
-	err = db.QueryRow("SELECT MAX(ROWID) FROM message").Scan(&maxID)
+	err = stmt.QueryRow().Scan(&maxID)
 	if err != nil || !maxID.Valid {
 		return 0
 	}
@@ -124,20 +166,15 @@ func (w *MessageWatcher) getLastMessageID() int64 {
 }
 
 func (w *MessageWatcher) getDBMtime() int64 {
-	dbPath := database.GetDBPath()
 	var latest int64
 
-	// Check main db file
-	info, err := os.Stat(dbPath)
-	if err == nil {
-		latest = info.ModTime().UnixNano()
-	}
-
-	// Also check WAL and SHM files — iMessage uses WAL mode, so writes
-	// often land in chat.db-wal without touching the main file's mtime.
-	for _, suffix := range []string{"-wal", "-shm"} {
-		if wi, err := os.Stat(dbPath + suffix); err == nil {
-			if mt := wi.ModTime().UnixNano(); mt > latest {
+	// Check the main db file along with its WAL — iMessage uses WAL mode,
+	// so writes often land in chat.db-wal without touching the main file's
+	// mtime. chat.db-shm is left out: every reader, our own poll queries
+	// included, updates it, so it would report a change on every poll.
+	for _, path := range w.dbFiles {
+		if info, err := os.Stat(path); err == nil {
+			if mt := info.ModTime().UnixNano(); mt > latest {
 				latest = mt
 			}
 		}
@@ -146,16 +183,34 @@ func (w *MessageWatcher) getDBMtime() int64 {
 	return latest
 }
 
-// GetConversations returns a list of conversations.
+// GetConversations returns a list of conversations. The result is cached
+// until the database mtime (including the WAL) changes, so repeated calls
+// against an unchanged database skip the query. Callers must not modify
+// the returned slice.
 func (w *MessageWatcher) GetConversations(limit int) []Conversation {
+	// Read the mtime before querying: a write that lands during the query
+	// bumps it again, so the cached result is never treated as newer than
+	// it is.
+	mtime := w.getDBMtime()
+
+	w.convMu.Lock()
+	defer w.convMu.Unlock()
+	if w.convCache != nil && w.convCacheLimit == limit && w.convCacheMtime == mtime {
+		return w.convCache
+	}
+
 	convs, err := database.GetConversations(limit)
 	if err != nil {
 		return nil
 	}
 
-	var result []Conversation
-	for _, c := range convs {
-		result = append(result, Conversation{
+	if len(convs) == 0 {
+		return nil
+	}
+
+	result := make([]Conversation, len(convs))
+	for i, c := range convs {
+		result[i] = Conversation{
 			ChatID:          c.ChatID,
 			ChatIdentifier:  c.ChatIdentifier,
 			DisplayName:     c.DisplayName,
@@ -164,8 +219,12 @@ func (w *MessageWatcher) GetConversations(limit int) []Conversation {
 			LastMessageText: c.LastMessageText,
 			UnreadCount:     c.UnreadCount,
 			Participants:    c.Participants,
-		})
+		}
 	}
+
+	w.convCache = result
+	w.convCacheLimit = limit
+	w.convCacheMtime = mtime
 	return result
 }
 
@@ -175,10 +234,28 @@ func (w *MessageWatcher) GetMessages(chatID int64, limit int) []Message {
 	if err != nil {
 		return nil
 	}
+	return convertMessages(msgs)
+}
+
+// GetMessagesSince returns up to limit of a chat's newest messages with an
+// ID greater than afterID.
+func (w *MessageWatcher) GetMessagesSince(chatID, afterID int64, limit int) []Message {
+	msgs, err := database.GetMessagesSince(chatID, "", afterID, limit)
+	if err != nil {
+		return nil
+	}
+	return convertMessages(msgs)
+}
+
+// convertMessages converts database messages to watcher messages.
+func convertMessages(msgs []database.Message) []Message {
+	if len(msgs) == 0 {
+		return nil
+	}
 
-	var result []Message
-	for _, m := range msgs {
-		msg := Message{
+	result := make([]Message, len(msgs))
+	for i, m := range msgs {
+		result[i] = Message{
 			MessageID:      m.MessageID,
 			Text:           m.Text,
 			Date:           m.Date,
@@ -189,8 +266,12 @@ func (w *MessageWatcher) GetMessages(chatID int64, limit int) []Message {
 			ChatIdentifier: m.ChatIdent,
 			ChatName:       m.ChatName,
 		}
-		for _, a := range m.Attachments {
-			msg.Attachments = append(msg.Attachments, Attachment{
+		if len(m.Attachments) == 0 {
+			continue
+		}
+		atts := make([]Attachment, len(m.Attachments))
+		for j, a := range m.Attachments {
+			atts[j] = Attachment{
 				AttachmentID: a.AttachmentID,
 				Filename:     a.Filename,
 				FilePath:     a.FilePath,
@@ -198,42 +279,22 @@ func (w *MessageWatcher) GetMessages(chatID int64, limit int) []Message {
 				UTI:          a.UTI,
 				TotalBytes:   a.TotalBytes,
 				IsImage:      a.IsImage,
-			})
+			}
 		}
-		result = append(result, msg)
+		result[i].Attachments = atts
 	}
 	return result
 }
 
 // GetNewMessages returns messages newer than the given ID.
 func (w *MessageWatcher) GetNewMessages(sinceID int64) []Message {
-	db, err := database.DB()
+	stmt, err := database.Prepare(newMessagesQuery)
 	if err != nil {
 		w.notifyError(err)
 		return nil
 	}
 
-	query := `
-		SELECT 
-			m.ROWID as message_id,
-			m.text,
-			m.attributedBody,
-			m.date,
-			m.is_from_me,
-			m.is_read,
-			h.id as sender_id,
-			c.ROWID as chat_id,
-			c.chat_identifier,
-			c.display_name
-		FROM message m
-		LEFT JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
-		LEFT JOIN chat c ON cmj.chat_id = c.ROWID
-		LEFT JOIN handle h ON m.handle_id = h.ROWID
-		WHERE m.ROWID > ?
-		ORDER BY m.date ASC
-	`
-
-	rows, err := db.Query(query, sinceID)
+	rows, err := stmt.Query(sinceID)
 	if err != nil {
 		return nil
 	}
@@ -243,7 +304,7 @@ func (w *MessageWatcher) GetNewMessages(sinceID int64) []Message {
 	for rows.Next() {
 		var m Message
 		var text, senderID, chatIdent, chatName sql.NullString
-		var attributedBody []byte
+		var attributedBody sql.RawBytes
 		var date sql.NullInt64
 		var isFromMe, isRead int
 
@@ -284,20 +345,42 @@ func (w *MessageWatcher) GetNewMessages(sinceID int64) []Message {
 func (w *MessageWatcher) pollLoop() {
 	defer w.wg.Done()
 
-	ticker := time.NewTicker(w.pollInterval)
-	defer ticker.Stop()
+	timer := time.NewTimer(w.pollInterval)
+	defer timer.Stop()
 
+	idlePolls := 0
 	for {
 		select {
 		case <-w.stopCh:
 			return
-		case <-ticker.C:
-			w.poll()
+		case <-timer.C:
+		case <-w.wakeCh:
+			idlePolls = 0
+		}
+
+		if w.poll() {
+			idlePolls = 0
+		} else {
+			idlePolls++
 		}
+		timer.Reset(w.nextPollInterval(idlePolls))
 	}
 }
 
-func (w *MessageWatcher) poll() {
+// nextPollInterval backs off while the database is idle: the interval
+// doubles after every IdlePollsPerBackoff polls that found no change, up to
+// MaxPollInterval. Any change or Wake drops it back to pollInterval.
+func (w *MessageWatcher) nextPollInterval(idlePolls int) time.Duration {
+	interval := w.pollInterval
+	for i := idlePolls / IdlePollsPerBackoff; i > 0 && interval < MaxPollInterval; i-- {
+		interval *= 2
+	}
+	return min(interval, max(MaxPollInterval, w.pollInterval))
+}
+
+// poll checks the database for changes, notifying callbacks of any it
+// finds, and reports whether there were any.
+func (w *MessageWatcher) poll() bool {
 	// Always check for new messages by comparing the max message ROWID.
 	// This is a cheap query and avoids relying solely on file mtime which
 	// can miss changes when SQLite WAL mode is in use.
@@ -356,6 +439,19 @@ func (w *MessageWatcher) poll() {
 			}(cb, conversations)
 		}
 	}
+
+	return currentMaxID > lastID || currentMtime > lastMtime
+}
+
+// Wake makes the poll loop check the database now instead of at the next
+// tick. Call it after writing to chat.db (e.g. sending a message) so the
+// change shows up without waiting out the poll interval. Wakes that arrive
+// while one is already pending are merged.
+func (w *MessageWatcher) Wake() {
+	select {
+	case w.wakeCh <- struct{}{}:
+	default:
+	}
 }
 
 func (w *MessageWatcher) notifyError(err error) {
@@ -377,8 +473,12 @@ func (w *MessageWatcher) Start() {
 	// Mark running and create stop channel immediately to avoid blocking
 	w.running = true
 	w.stopCh = make(chan struct{})
+	stopCh := w.stopCh
 	w.mu.Unlock()
 
+	// Where the OS can report writes to chat.db, poll as soon as they happen
+	w.watchDBFiles(stopCh)
+
 	// Start poll loop in a goroutine; perform initial DB checks there to avoid blocking caller
 	w.wg.Add(1)
 	go func() {
@@ -386,6 +486,10 @@ func (w *MessageWatcher) Start() {
 		w.lastMessageID.Store(w.getLastMessageID())
 		w.lastMtime.Store(w.getDBMtime())
 
+		// Prepare the new-messages query now so the first poll that sees
+		// a message doesn't pay for it
+		database.Prepare(newMessagesQuery)
+
 		w.pollLoop()
 	}()
 }
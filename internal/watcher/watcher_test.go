@@ -0,0 +1,33 @@
+package watcher
+
+import (
+	"testing"
+	"time"
+)
+
+func TestNextPollInterval(t *testing.T) {
+	w := &MessageWatcher{pollInterval: 500 * time.Millisecond}
+
+	tests := []struct {
+		idlePolls int
+		want      time.Duration
+	}{
+		{0, 500 * time.Millisecond},
+		{IdlePollsPerBackoff - 1, 500 * time.Millisecond},
+		{IdlePollsPerBackoff, time.Second},
+		{2 * IdlePollsPerBackoff, 2 * time.Second},
+		{3 * IdlePollsPerBackoff, MaxPollInterval},
+		{1000 * IdlePollsPerBackoff, MaxPollInterval},
+	}
+	for _, tt := range tests {
+		if got := w.nextPollInterval(tt.idlePolls); got != tt.want {
+			t.Errorf("nextPollInterval(%d) = %v, want %v", tt.idlePolls, got, tt.want)
+		}
+	}
+
+	// A base interval above the cap is never shortened
+	slow := &MessageWatcher{pollInterval: 2 * MaxPollInterval}
+	if got := slow.nextPollInterval(10 * IdlePollsPerBackoff); got != 2*MaxPollInterval {
+		t.Errorf("nextPollInterval with a slow base = %v, want %v", got, 2*MaxPollInterval)
+	}
+}